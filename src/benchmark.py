@@ -0,0 +1,185 @@
+"""
+Headless benchmark for the demo scenes.
+
+Renders every scene for a number of frames of scripted rotation input on an offscreen surface and reports per frame
+time percentiles and segments drawn per second, run from this directory:
+
+    python benchmark.py --frames 200 --output results.json
+    python benchmark.py --scenes sphere_wireframe --max-p95 sphere_wireframe=40
+    python benchmark.py --baseline results.json --tolerance 0.2
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+from time import perf_counter
+
+import numpy as np
+import skia
+
+from lib.headless import HeadlessWindow, HeadlessEvent, KEY_RIGHT, KEY_LEFT, KEY_UP, KEY_DOWN
+
+# chess modules import through the src package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# scene name -> (module, width, height)
+SCENES = {
+    "simple_cube": ("simple_cube", 1000, 1000),
+    "cube_on_plane": ("cube_on_plane", 1000, 1000),
+    "perspective": ("perspective", 1000, 1000),
+    "rotatable_ring": ("rotatable_ring", 1920, 1080),
+    "sphere_wireframe": ("sphere_wireframe", 1920, 1080),
+    "chess": ("src.chess.main", 800, 800),
+}
+# Mostly spins right with regular tilts, so both rotation axes are exercised.
+ROTATION_SCRIPT = (KEY_RIGHT, KEY_RIGHT, KEY_RIGHT, KEY_UP, KEY_RIGHT, KEY_RIGHT, KEY_RIGHT, KEY_DOWN, KEY_LEFT)
+PERCENTILES = (50, 90, 95, 99)
+
+
+class CountingCanvas:
+    """
+    Forwards everything to a skia canvas while counting the line segments submitted to it.
+    """
+
+    def __init__(self, canvas: skia.Canvas):
+        self.canvas = canvas
+        self.segments = 0
+
+    def drawLine(self, *args):
+        self.segments += 1
+        self.canvas.drawLine(*args)
+
+    def drawPoints(self, mode, points, paint):
+        if mode == skia.Canvas.kLines_PointMode:
+            self.segments += len(points) // 2
+        elif mode == skia.Canvas.kPolygon_PointMode:
+            self.segments += max(len(points) - 1, 0)
+        self.canvas.drawPoints(mode, points, paint)
+
+    def drawPath(self, path, paint):
+        self.segments += max(path.countVerbs() - 1, 0)
+        self.canvas.drawPath(path, paint)
+
+    def __getattr__(self, item):
+        return getattr(self.canvas, item)
+
+
+def scripted_events(frames):
+    for i in range(frames):
+        yield ROTATION_SCRIPT[i % len(ROTATION_SCRIPT)]
+
+
+def run_scene(name, frames, fps=60):
+    module_name, width, height = SCENES[name]
+    scene = importlib.import_module(module_name)
+    window = HeadlessWindow(width, height)
+    counter = None
+
+    # wrap the scene callbacks so every frame draws through a CountingCanvas
+    if hasattr(scene, "event_loop"):
+        window.event_loop = lambda canvas, event: scene.event_loop(counter, event)
+    else:
+        window.frame_renderer = lambda canvas, time: scene.frame_renderer(counter, time)
+
+    frame_times = []
+    segments = 0
+    for i, key in enumerate(scripted_events(frames)):
+        counter = CountingCanvas(window.skia_surface.getCanvas())
+        start = perf_counter()
+        window.render_frame(HeadlessEvent(key), i / fps)
+        frame_times.append(perf_counter() - start)
+        segments += counter.segments
+
+    frame_times = np.array(frame_times) * 1000
+    total = frame_times.sum() / 1000
+    result = {
+        "frames": frames,
+        "width": width,
+        "height": height,
+        "mean_ms": float(frame_times.mean()),
+        "max_ms": float(frame_times.max()),
+        "segments": segments,
+        "segments_per_second": segments / total if total else 0.0,
+        "fps": frames / total if total else 0.0,
+    }
+    for percentile in PERCENTILES:
+        result[f"p{percentile}_ms"] = float(np.percentile(frame_times, percentile))
+    return result
+
+
+def check_thresholds(results, max_p95, baseline, tolerance):
+    failures = []
+    for name, limit in max_p95.items():
+        if name in results and results[name]["p95_ms"] > limit:
+            failures.append(f"{name}: p95 {results[name]['p95_ms']:.2f}ms > {limit:.2f}ms")
+
+    for name, previous in (baseline or {}).items():
+        if name not in results:
+            continue
+        allowed = previous["p50_ms"] * (1 + tolerance)
+        if results[name]["p50_ms"] > allowed:
+            failures.append(
+                f"{name}: p50 {results[name]['p50_ms']:.2f}ms regressed from {previous['p50_ms']:.2f}ms "
+                f"(allowed {allowed:.2f}ms)"
+            )
+    return failures
+
+
+def parse_thresholds(values):
+    thresholds = {}
+    for value in values:
+        name, _, limit = value.partition("=")
+        if name not in SCENES or not limit:
+            raise ValueError(f"expected <scene>=<milliseconds>, got {value!r}")
+        thresholds[name] = float(limit)
+    return thresholds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the demo scenes headlessly.")
+    parser.add_argument("--scenes", nargs="+", choices=list(SCENES), default=list(SCENES))
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--max-p95", nargs="*", default=[], metavar="SCENE=MS",
+                        help="fail if a scene's 95th percentile frame time exceeds MS")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative p50 regression against the baseline")
+    args = parser.parse_args(argv)
+    try:
+        max_p95 = parse_thresholds(args.max_p95)
+    except ValueError as error:
+        parser.error(str(error))
+
+    results = {}
+    for name in args.scenes:
+        results[name] = run_scene(name, args.frames)
+        r = results[name]
+        print(
+            f"{name:<18} p50 {r['p50_ms']:8.2f}ms  p95 {r['p95_ms']:8.2f}ms  p99 {r['p99_ms']:8.2f}ms  "
+            f"{r['segments_per_second']:12.0f} segments/s"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "skia": skia.__version__,
+                "scenes": results,
+            }, file, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["scenes"]
+
+    failures = check_thresholds(results, max_p95, baseline, args.tolerance)
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+from heapq import heappush, heappop
+from typing import List, Dict, Tuple
+
+from src.chess.solver import Cell, KNIGHT_DX, KNIGHT_DY, cell_xy
+from src.lib.mathematical_land import Vector
+
+KNIGHT_STEPS = tuple(zip(KNIGHT_DX.tolist(), KNIGHT_DY.tolist()))
+
+
+def knight_distance_bound(dx: int, dy: int) -> int:
+    """
+    Lower bound on the knight moves needed to cover (dx, dy) on an open board. A move covers at most 2 along either
+    axis and at most 3 in total, and every move flips the color of the square, so the bound is bumped to the parity
+    of dx + dy. It changes by exactly one per move, which keeps A* from ever reopening a cell.
+    """
+    dx, dy = abs(dx), abs(dy)
+    bound = max((dx + 1) // 2, (dy + 1) // 2, (dx + dy + 2) // 3)
+    if (bound + dx + dy) % 2:
+        bound += 1
+    return bound
+
+
+class AStarBoard:
+    """
+    A* knight search for boards too large to materialize, only the cells it actually visits are stored. Pass
+    rows/columns as None for an unbounded board. Takes the same arguments as Board and solve() returns the same
+    Cell path, empty if the target is unreachable or max_expansions cells were expanded without reaching it.
+    """
+
+    def __init__(self, rows, columns, obstacles, target, horse, max_expansions=10_000_000):
+        self.rows = rows
+        self.columns = columns
+        self.obstacles = {cell_xy(obstacle) for obstacle in obstacles}
+        self.target = cell_xy(target)
+        self.horse = cell_xy(horse)
+        self.max_expansions = max_expansions
+
+        self.expanded = 0
+        self.came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.moves: Dict[Tuple[int, int], int] = {}
+        self.found = self.search()
+
+    def out_of_bounds(self, x, y):
+        return (
+            (self.columns is not None and not 0 <= x < self.columns) or
+            (self.rows is not None and not 0 <= y < self.rows)
+        )
+
+    def search(self) -> bool:
+        target_x, target_y = self.target
+        moves, came_from, obstacles = self.moves, self.came_from, self.obstacles
+        moves[self.horse] = 0
+        # (estimated total, -moves so deeper cells win ties, insertion counter, cell)
+        queue = [(knight_distance_bound(target_x - self.horse[0], target_y - self.horse[1]), 0, 0, self.horse)]
+        counter = 0
+        closed = set()
+
+        while queue:
+            _, negative_moves, _, cell = heappop(queue)
+            if cell in closed:
+                continue
+            if cell == self.target:
+                return True
+            closed.add(cell)
+
+            self.expanded += 1
+            if self.expanded > self.max_expansions:
+                return False
+
+            next_moves = 1 - negative_moves
+            x, y = cell
+            for dx, dy in KNIGHT_STEPS:
+                end = (x + dx, y + dy)
+                if end in closed or end in obstacles or self.out_of_bounds(*end):
+                    continue
+                if next_moves < moves.get(end, next_moves + 1):
+                    moves[end] = next_moves
+                    came_from[end] = cell
+                    counter += 1
+                    estimate = next_moves + knight_distance_bound(target_x - end[0], target_y - end[1])
+                    heappush(queue, (estimate, -next_moves, counter, end))
+        return False
+
+    @property
+    def min_moves(self) -> int:
+        return self.moves[self.target] if self.found else -1
+
+    def solve(self) -> List[Cell]:
+        if not self.found or self.target == self.horse:
+            return []
+
+        cells = [self.target]
+        while cells[-1] != self.horse:
+            cells.append(self.came_from[cells[-1]])
+
+        prev_cell = Vector(*self.horse)
+        path = []
+        for xy in reversed(cells[:-1]):
+            cell = Cell(Vector(*xy))
+            cell.plant_flag(self.moves[xy], prev_cell)
+            path.append(cell)
+            prev_cell = cell
+        path.reverse()
+        return path
@@ -0,0 +1,130 @@
+from typing import Tuple
+
+import numpy as np
+
+from src.chess.renderer import ChessBoard
+from src.chess.solver import KNIGHT_DX, KNIGHT_DY
+
+
+def random_boards(count: int, rows=8, columns=8, rng: np.random.Generator = None):
+    """
+    Draws `count` boards the way ChessBoard does: OBSTACLE_MIN..OBSTACLE_MAX random obstacle cells (duplicates
+    allowed), a random target that is never an obstacle and a horse on a random free cell.
+    Returns (obstacles (count, rows, columns) bool, horses (count, 2), targets (count, 2)), positions as (x, y).
+    """
+    rng = rng or np.random.default_rng()
+    boards = np.arange(count)
+
+    obstacles = np.zeros((count, rows, columns), dtype=bool)
+    obstacle_counts = rng.integers(ChessBoard.OBSTACLE_MIN, ChessBoard.OBSTACLE_MAX + 1, count)
+    cells = rng.integers(0, rows * columns, (count, ChessBoard.OBSTACLE_MAX))
+    used = np.arange(ChessBoard.OBSTACLE_MAX) < obstacle_counts[:, None]
+    obstacles.reshape(count, -1)[np.broadcast_to(boards[:, None], cells.shape)[used], cells[used]] = True
+
+    targets = np.column_stack((rng.integers(0, columns, count), rng.integers(0, rows, count)))
+    obstacles[boards, targets[:, 1], targets[:, 0]] = False
+
+    # horse on a uniformly random free cell: the free cell with the largest random key
+    keys = rng.random((count, rows * columns))
+    keys[obstacles.reshape(count, -1)] = -1
+    keys[boards, targets[:, 1] * columns + targets[:, 0]] = -1
+    horse_cells = keys.argmax(axis=1)
+    horses = np.column_stack((horse_cells % columns, horse_cells // columns))
+
+    return obstacles, horses, targets
+
+
+def shift_or(source: np.ndarray, destination: np.ndarray, dx: int, dy: int):
+    # destination[:, y + dy, x + dx] |= source[:, y, x], dropping whatever falls off the board
+    _, rows, columns = source.shape
+    destination[:, max(dy, 0):rows + min(dy, 0), max(dx, 0):columns + min(dx, 0)] |= \
+        source[:, max(-dy, 0):rows + min(-dy, 0), max(-dx, 0):columns + min(-dx, 0)]
+
+
+def batch_solve(obstacles: np.ndarray, horses: np.ndarray, targets: np.ndarray, paths=False) -> Tuple:
+    """
+    Knight BFS on a whole stack of boards at once, every step advances all frontiers by OR-ing the 8 shifted frontier
+    grids. Returns the minimum move count per board (-1 when unreachable) and the (count, rows, columns) distance
+    grids. With paths=True a (count, max_moves, 2) array of (x, y) cells is returned too, ordered like Board.solve()
+    (target first, first move last) and padded with -1. Ties between equally short paths may resolve differently
+    from Board.
+    """
+    count, rows, columns = obstacles.shape
+    boards = np.arange(count)
+
+    distance = np.full(obstacles.shape, -1, dtype=np.int16)
+    visited = obstacles.copy()
+    frontier = np.zeros(obstacles.shape, dtype=bool)
+    frontier[boards, horses[:, 1], horses[:, 0]] = True
+    visited |= frontier
+    distance[frontier] = 0
+
+    reached = np.zeros(obstacles.shape, dtype=bool)
+    done = np.zeros(count, dtype=bool)
+    step = 0
+    while frontier.any() and not done.all():
+        step += 1
+        reached[:] = False
+        for dx, dy in zip(KNIGHT_DX, KNIGHT_DY):
+            shift_or(frontier, reached, dx, dy)
+        reached &= ~visited
+        reached[done] = False
+
+        visited |= reached
+        distance[reached] = step
+        frontier, reached = reached, frontier
+        done |= distance[boards, targets[:, 1], targets[:, 0]] >= 0
+
+    moves = distance[boards, targets[:, 1], targets[:, 0]].astype(np.int32)
+    if not paths:
+        return moves, distance
+    return moves, distance, trace_paths(distance, targets, moves)
+
+
+def trace_paths(distance: np.ndarray, targets: np.ndarray, moves: np.ndarray) -> np.ndarray:
+    """
+    Walks every board from its target back towards the horse, stepping to the first neighbor (in ALLOWED_MOVES order)
+    that is one move closer.
+    """
+    count, rows, columns = distance.shape
+    boards = np.arange(count)
+    longest = max(int(moves.max()), 0)
+    paths = np.full((count, longest, 2), -1, dtype=np.int32)
+
+    current = targets.astype(np.int32).copy()
+    for index in range(longest):
+        active = moves > index
+        paths[active, index] = current[active]
+
+        remaining = moves - index  # distance of current cell
+        previous_x = current[:, 0, None] - KNIGHT_DX
+        previous_y = current[:, 1, None] - KNIGHT_DY
+        in_bounds = (0 <= previous_x) & (previous_x < columns) & (0 <= previous_y) & (previous_y < rows)
+        closer = np.zeros(in_bounds.shape, dtype=bool)
+        closer[in_bounds] = distance[
+            np.broadcast_to(boards[:, None], in_bounds.shape)[in_bounds], previous_y[in_bounds], previous_x[in_bounds]
+        ] == np.broadcast_to(remaining[:, None] - 1, in_bounds.shape)[in_bounds]
+
+        choice = closer.argmax(axis=1)
+        current = np.where(
+            active[:, None],
+            np.column_stack((previous_x[boards, choice], previous_y[boards, choice])),
+            current
+        )
+    return paths
+
+
+def move_count_distribution(moves: np.ndarray) -> dict:
+    # minimum move count -> number of boards, unreachable targets are counted under -1
+    values, counts = np.unique(moves, return_counts=True)
+    return dict(zip(values.tolist(), counts.tolist()))
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    start = perf_counter()
+    board_count = 100_000
+    solution = batch_solve(*random_boards(board_count))
+    print(f"{board_count} boards in {perf_counter() - start:.2f}s")
+    print(move_count_distribution(solution[0]))
@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from typing import List
+
+import numpy as np
+
+from src.chess.solver import Cell, KNIGHT_DX, KNIGHT_DY, cell_xy, occupancy_grid, knight_bfs, cells_from_indices
+
+NO_MOVE = 255
+
+
+class KnightDistanceField:
+    """
+    Knight move distances from one source to every cell of a board, from a single BFS over the whole board.
+    Instead of a parent index per cell only the (uint8) index of the move that reached it is kept, which is enough to
+    walk any path back to the source in O(path length).
+    """
+
+    def __init__(self, rows: int, columns: int, obstacles, source):
+        self.rows = rows
+        self.columns = columns
+        self.source = cell_xy(source)
+
+        distance, parent = knight_bfs(occupancy_grid(rows, columns, obstacles), source)
+        self.distance = distance.astype(np.int16 if distance.max() < np.iinfo(np.int16).max else np.int32)
+
+        # move index reaching every cell, looked up from the parent -> cell step
+        self.move = np.full(rows * columns, NO_MOVE, dtype=np.uint8)
+        reached = np.flatnonzero(parent >= 0)
+        dx = reached % columns - parent[reached] % columns
+        dy = reached // columns - parent[reached] // columns
+        move_of_step = np.full((5, 5), NO_MOVE, dtype=np.uint8)
+        move_of_step[KNIGHT_DY + 2, KNIGHT_DX + 2] = np.arange(len(KNIGHT_DX))
+        self.move[reached] = move_of_step[dy + 2, dx + 2]
+        self.move_offsets = KNIGHT_DY * columns + KNIGHT_DX
+
+    @property
+    def nbytes(self) -> int:
+        return self.distance.nbytes + self.move.nbytes
+
+    def index(self, cell) -> int:
+        x, y = cell_xy(cell)
+        return y * self.columns + x
+
+    def distance_to(self, target) -> int:
+        # -1 when the target can not be reached.
+        return int(self.distance[self.index(target)])
+
+    def path_to(self, target) -> List[Cell]:
+        """
+        Same output as Board.solve() for a horse on the source cell.
+        """
+        index = self.index(target)
+        if self.distance[index] <= 0:
+            return []
+
+        indices = []
+        while self.move[index] != NO_MOVE:
+            indices.append(index)
+            index -= self.move_offsets[self.move[index]]
+        return cells_from_indices(indices, index, self.distance, self.columns)
+
+
+class FieldCache:
+    """
+    Least recently used KnightDistanceFields keyed by (rows, columns, obstacles, source), evicting the oldest fields
+    once their combined size exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.fields = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(rows, columns, obstacles, source):
+        return rows, columns, frozenset(cell_xy(obstacle) for obstacle in obstacles), cell_xy(source)
+
+    def get(self, rows: int, columns: int, obstacles, source) -> KnightDistanceField:
+        key = self.key(rows, columns, obstacles, source)
+        field = self.fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self.fields.move_to_end(key)
+            return field
+
+        self.misses += 1
+        field = KnightDistanceField(rows, columns, obstacles, source)
+        self.fields[key] = field
+        self.nbytes += field.nbytes
+        # always keep the newest field, even if it alone is over budget
+        while self.nbytes > self.max_bytes and len(self.fields) > 1:
+            _, evicted = self.fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return field
+
+    def clear(self):
+        self.fields.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f"FieldCache(fields={len(self)}, bytes={self.nbytes}, hits={self.hits}, misses={self.misses})"
+
+
+field_cache = FieldCache()
+
+
+def distance_field(rows: int, columns: int, obstacles, source, cache: FieldCache = field_cache) -> KnightDistanceField:
+    return cache.get(rows, columns, obstacles, source)
@@ -3,15 +3,16 @@ import skia
 from src.chess.ui_backend import Window
 from src.lib.mathematical_land import Vector
 from src.chess.renderer import ChessBoard, Horse
-from src.chess.solver import Board
+from src.chess.solver import GridBoard
+from src.lib.paint_registry import shared_paint
 
 board = ChessBoard()
 horse = Horse(board)
 # noinspection PyArgumentList
-solver = Board(board.rows, board.columns, [Vector(*o) for o in board.obstacles], Vector(*board.target), horse.position)
+solver = GridBoard(board.rows, board.columns, [Vector(*o) for o in board.obstacles], Vector(*board.target), horse.position)
 path = solver.solve()
 start = horse
-paint = skia.Paint(Color=skia.Color(0, 255, 0), StrokeWidth=5)
+paint = shared_paint(skia.Color(0, 255, 0), 5)
 
 
 def frame_renderer(canvas: skia.Canvas, time):
@@ -35,9 +36,20 @@ def frame_renderer(canvas: skia.Canvas, time):
             end.position.x * 100 + 50, end.position.y * 100 + 50,
             15, paint
         )
+        # the segment and both end circles
+        x1, x2 = sorted((start.position.x, end.position.x))
+        y1, y2 = sorted((start.position.y, end.position.y))
+        margin = 15 + paint.getStrokeWidth()
+        board.damaged_rects.append((
+            x1 * 100 + 50 - margin, y1 * 100 + 50 - margin,
+            (x2 - x1) * 100 + 2 * margin, (y2 - y1) * 100 + 2 * margin
+        ))
         start = end
 
+    return board.damaged_rects
 
-window = Window("Raj's Question", 800, 800)
-window.frame_renderer = frame_renderer
-window.main_loop()
+
+if __name__ == "__main__":
+    window = Window("Raj's Question", 800, 800, damage_tracking=True)
+    window.frame_renderer = frame_renderer
+    window.main_loop()
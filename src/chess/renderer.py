@@ -2,6 +2,7 @@ from math import floor
 from random import randint, choice
 
 from src.lib.mathematical_land import Vector
+from src.lib.paint_registry import shared_paint
 
 import skia
 
@@ -21,7 +22,7 @@ class Square:
         # noinspection PyTypeChecker
         canvas.drawRect(
             skia.Rect(*self.position.xy, *bottom_right.xy),
-            skia.Paint(Color=self.color)
+            shared_paint(self.color)
         )
 
 
@@ -63,10 +64,12 @@ class Horse:
     def paint(self, canvas: skia.Canvas):
         self.board.dirty_cells = self.dirty_cells
 
+        x1, y1, x2, y2 = self.coordinates
+        self.board.damaged_rects.append((x1, y1, x2 - x1, y2 - y1))
         # noinspection PyTypeChecker
         canvas.drawRect(
             skia.Rect(*self.coordinates),
-            skia.Paint(Color=self.color)
+            shared_paint(self.color)
         )
 
 
@@ -76,11 +79,16 @@ class ChessBoard:
     OBSTACLE_COLOR = skia.Color(65, 65, 65)
     TARGET_COLOR = skia.Color(0, 0, 255)
 
-    def __init__(self, rows=8, columns=8):
+    def __init__(self, rows=8, columns=8, cached=True):
         self.rows = rows
         self.columns = columns
         self.dirty = True  # this will only be true once, false after first paint of the entire board.
+        # When cached, the static board (tiles, obstacles and target) is rasterized once into board_image and dirty
+        # cells are restored by copying from it, until the obstacles or the target change.
+        self.cached = cached
+        self.board_image = None
         self.dirty_cells = []
+        self.damaged_rects = []  # (x, y, width, height) of everything painted since the last paint() call
 
         self.obstacles = self.generate_obstacles()
         self.target = self.random_cell
@@ -88,6 +96,7 @@ class ChessBoard:
             self.obstacles.remove(self.target)
 
         self.squares = self.generate_board()
+        self.board_key = self.static_key
 
     def generate_obstacles(self):
         return [self.random_cell for _ in range(randint(self.OBSTACLE_MIN, self.OBSTACLE_MAX))]
@@ -125,19 +134,55 @@ class ChessBoard:
 
         return board
 
+    @property
+    def static_key(self):
+        return tuple(self.obstacles), self.target
+
+    def refresh_static_board(self):
+        # Rebuilds the squares and drops the cached image if obstacles or target changed since the last paint.
+        key = self.static_key
+        if key == self.board_key:
+            return
+        self.board_key = key
+        self.squares = self.generate_board()
+        self.board_image = None
+        self.dirty = True
+
+    def render_board_image(self) -> skia.Image:
+        surface = skia.Surface(self.columns * CELL_SIZE, self.rows * CELL_SIZE)
+        with surface as canvas:
+            for square in self.squares.values():
+                square.paint(canvas)
+        return surface.makeImageSnapshot()
+
     def redraw_dirty_cells(self, canvas: skia.Canvas):
         for cell in self.dirty_cells:
             if cell in self.squares:
-                self.squares[cell].paint(canvas)
+                x, y = cell
+                rect = (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                if self.cached:
+                    canvas.drawImageRect(self.board_image, skia.Rect.MakeXYWH(*rect), skia.Rect.MakeXYWH(*rect))
+                else:
+                    self.squares[cell].paint(canvas)
+                self.damaged_rects.append(rect)
 
     def paint(self, canvas: skia.Canvas):
+        self.damaged_rects = []
+        self.refresh_static_board()
+        if self.cached and self.board_image is None:
+            self.board_image = self.render_board_image()
+
         self.redraw_dirty_cells(canvas)
 
         if not self.dirty:
             return
 
-        for square in self.squares.values():
-            square.paint(canvas)
+        if self.cached:
+            canvas.drawImage(self.board_image, 0, 0)
+        else:
+            for square in self.squares.values():
+                square.paint(canvas)
+        self.damaged_rects.append((0, 0, self.columns * CELL_SIZE, self.rows * CELL_SIZE))
 
         self.dirty = False
 
@@ -1,4 +1,7 @@
 from typing import List, Dict, Tuple
+
+import numpy as np
+
 from src.lib.mathematical_land import Vector
 
 ALLOWED_MOVES = [
@@ -99,6 +102,128 @@ class Board:
         return path
 
 
+KNIGHT_DX = np.array([int(move.x) for move in ALLOWED_MOVES])
+KNIGHT_DY = np.array([int(move.y) for move in ALLOWED_MOVES])
+
+
+def cell_xy(cell) -> Tuple[int, int]:
+    # Accepts Vectors as well as (x, y) tuples.
+    if isinstance(cell, Vector):
+        return cell.i_xy
+    return int(cell[0]), int(cell[1])
+
+
+def occupancy_grid(rows: int, columns: int, obstacles) -> np.ndarray:
+    blocked = np.zeros((rows, columns), dtype=bool)
+    if obstacles:
+        xs, ys = np.array([cell_xy(obstacle) for obstacle in obstacles]).T
+        blocked[ys, xs] = True
+    return blocked
+
+
+def knight_bfs(blocked: np.ndarray, source, target=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Breadth first search from `source` over a (rows, columns) occupancy grid, expanding a whole layer per step.
+    Returns flat (y * columns + x) distance and parent arrays, -1 marks unreached cells and the source has no parent.
+    Stops after the layer that reaches `target` when one is given. Cells are discovered in the same order as
+    Board.plant, so ties resolve to the same parents.
+    """
+    rows, columns = blocked.shape
+    # a blocked border two cells wide turns every knight move into a fixed offset without bounds checks
+    width = columns + 4
+    visited = np.pad(blocked, 2, constant_values=True).reshape(-1)
+    distance = np.full(visited.shape, -1, dtype=np.int32)
+    parent = np.full(visited.shape, -1, dtype=np.int32)
+    offsets = KNIGHT_DY * width + KNIGHT_DX
+
+    source_x, source_y = cell_xy(source)
+    source_index = (source_y + 2) * width + source_x + 2
+    visited[source_index] = True
+    distance[source_index] = 0
+    target_index = None
+    if target is not None:
+        target_x, target_y = cell_xy(target)
+        target_index = (target_y + 2) * width + target_x + 2
+
+    first_seen = np.empty(visited.shape, dtype=np.int64)
+    frontier = np.array([source_index])
+    count = 0
+    while len(frontier) and (target_index is None or distance[target_index] < 0):
+        count += 1
+        candidates = (frontier[:, None] + offsets).reshape(-1)
+        order = np.flatnonzero(~visited[candidates])
+        candidates = candidates[order]
+
+        # keep the first discovery of every cell: written back to front, the earliest write lands last
+        first_seen[candidates[::-1]] = order[::-1]
+        keep = first_seen[candidates] == order
+        frontier = candidates[keep]
+
+        visited[frontier] = True
+        distance[frontier] = count
+        parent[frontier] = frontier - offsets[order[keep] % len(offsets)]
+
+    # drop the border again
+    distance = distance.reshape(rows + 4, width)[2:-2, 2:-2].reshape(-1)
+    parent = parent.reshape(rows + 4, width)[2:-2, 2:-2].reshape(-1)
+    parent = np.where(parent >= 0, (parent // width - 2) * columns + parent % width - 2, -1).astype(np.int32)
+    return distance, parent
+
+
+def cell_path(distance: np.ndarray, parent: np.ndarray, columns: int, target) -> List[Cell]:
+    """
+    Rebuilds the Board.solve() output (target first, the first move last) from knight_bfs arrays.
+    """
+    target_x, target_y = cell_xy(target)
+    index = target_y * columns + target_x
+    if distance[index] <= 0:
+        return []
+
+    indices = []
+    while distance[index] > 0:
+        indices.append(index)
+        index = parent[index]
+    return cells_from_indices(indices, index, distance, columns)
+
+
+def cells_from_indices(indices, horse_index, distance, columns) -> List[Cell]:
+    # `indices` are flat cell indices running from the target back to the first move.
+    prev_cell = Vector(horse_index % columns, horse_index // columns)
+    path = []
+    for index in reversed(indices):
+        cell = Cell(Vector(index % columns, index // columns))
+        cell.plant_flag(int(distance[index]), prev_cell)
+        path.append(cell)
+        prev_cell = cell
+    path.reverse()
+    return path
+
+
+class GridBoard:
+    """
+    Drop in replacement for Board on large boards, the BFS runs over a numpy occupancy grid instead of a dict of
+    cells and lists of obstacles, solve() returns the same path.
+    """
+
+    def __init__(self, rows: int, columns: int, obstacles, target, horse):
+        self.rows = rows
+        self.columns = columns
+        self.obstacles = obstacles
+        self.target = target
+        self.horse = horse
+
+        self.blocked = occupancy_grid(rows, columns, obstacles)
+        self.distance, self.parent = knight_bfs(self.blocked, horse, target)
+
+    @property
+    def min_moves(self) -> int:
+        x, y = cell_xy(self.target)
+        return int(self.distance[y * self.columns + x])
+
+    def solve(self):
+        return cell_path(self.distance, self.parent, self.columns, self.target)
+
+
 if __name__ == "__main__":
     board = Board(8, 8, [Vector(5, 5)], Vector(0, 0), Vector(7, 7))
     print(board.solve())
@@ -1,30 +1,28 @@
 import math
 from ctypes import byref as pointer
-from time import time, sleep
 
 import sdl2 as sdl
 import skia
 
+from src.lib.frame_clock import FrameClock
+from src.lib.present_pipeline import WindowSurface, render_frame
+
 canvas_color = (40, 40, 40)
 fps = 60
 
 
-class Window:
+class Window(WindowSurface):
     DEFAULT_FLAGS = sdl.SDL_WINDOW_SHOWN | sdl.SDL_WINDOW_RESIZABLE
-    BYTE_ORDER = {
-        # ---------- ->   RED        GREEN       BLUE        ALPHA
-        "BIG_ENDIAN": (0xff000000, 0x00ff0000, 0x0000ff00, 0x000000ff),
-        "LIL_ENDIAN": (0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
-    }
-
-    PIXEL_DEPTH = 32  # BITS PER PIXEL
-    PIXEL_PITCH_FACTOR = 4  # Multiplied by Width to get BYTES PER ROW
 
-    def __init__(self, title, width, height, x=None, y=None, flags=None):
+    def __init__(self, title, width, height, x=None, y=None, flags=None, zero_copy=True, frame_stats=None,
+                 damage_tracking=False, pipelined=False):
         self.title = bytes(title, "utf8")
         self.width = width
         self.height = height
         self.frame_renderer = None
+        # optional frame_updater(dt), called at a fixed timestep independent of the rendered frame rate
+        self.frame_updater = None
+        self.clock = FrameClock(fps)
 
         self.canvas_color = canvas_color
 
@@ -41,18 +39,7 @@ class Window:
         else:
             self.flags = flags
 
-        # SET RGBA MASKS BASED ON BYTE_ORDER
-        is_big_endian = sdl.SDL_BYTEORDER == sdl.SDL_BIG_ENDIAN
-        self.RGBA_MASKS = self.BYTE_ORDER["BIG_ENDIAN" if is_big_endian else "LIL_ENDIAN"]
-
-        # CALCULATE PIXEL PITCH
-        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
-
-        # SKIA INIT
-        self.skia_surface = self.__create_skia_surface()
-        # Creating a member variable because SDL_CreateRGBSurfaceFrom does not keep pixel data but a pointer to it,
-        # so if it were to be a local variable it'd go out of scope and be deleted by the python garbage collector.
-        self.skia_pixel_data = None
+        self.init_surface(skia.Color(*self.canvas_color), zero_copy, frame_stats, damage_tracking, pipelined)
 
         # SDL INIT
         sdl.SDL_Init(sdl.SDL_INIT_EVENTS)  # INITIALIZE SDL EVENTS
@@ -67,110 +54,65 @@ class Window:
         )
         return window
 
-    def __create_skia_surface(self):
-        """
-        Initializes the main skia surface that will be drawn upon,
-        creates a raster surface.
-        """
-        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
-        surface_blueprint = skia.ImageInfo.Make(
-            self.width, self.height,
-            ct=skia.kRGBA_8888_ColorType,
-            at=skia.kUnpremul_AlphaType
-        )
-        # noinspection PyArgumentList
-        surface = skia.Surface.MakeRaster(surface_blueprint)
-
-        # make the canvas white by default
-        with surface as canvas:
-            canvas.drawColor(skia.Color(*self.canvas_color))
-
-        return surface
-
-    def __update_pixel_data_from_skia_surface(self):
-        """
-        Converts Skia Surface into a bytes object containing pixel data
-        """
-        image = self.skia_surface.makeImageSnapshot()
-        self.skia_pixel_data = image.tobytes()
-
-    def __transform_skia_surface_to_SDL_surface(self):
-        """
-        Converts Skia Surface to an SDL surface by first converting
-        Skia Surface to Pixel Data using .__update_pixel_data_from_skia_surface
-        """
-        self.__update_pixel_data_from_skia_surface()
-        sdl_surface = sdl.SDL_CreateRGBSurfaceFrom(
-            self.skia_pixel_data,
-            self.width, self.height,
-            self.PIXEL_DEPTH, self.PIXEL_PITCH,
-            *self.RGBA_MASKS
-        )
-        return sdl_surface
-
-    def update(self):
-        window_surface = sdl.SDL_GetWindowSurface(self.sdl_window)  # the SDL surface associated with the window
-        transformed_skia_surface = self.__transform_skia_surface_to_SDL_surface()
-        # Transfer skia surface to SDL window's surface
-        sdl.SDL_BlitSurface(
-            transformed_skia_surface, None,
-            window_surface, None
-        )
-
-        # Update window with new copied data
-        sdl.SDL_UpdateWindowSurface(self.sdl_window)
-
     def event_loop(self, event):
         while sdl.SDL_PollEvent(pointer(event)) != 0:
 
             window_resized = event.type == sdl.SDL_WINDOWEVENT and event.window.event == sdl.SDL_WINDOWEVENT_RESIZED
             if window_resized:
                 self.handle_resize(event)
+            elif event.type == sdl.SDL_WINDOWEVENT and event.window.event in self.REPAINT_WINDOW_EVENTS:
+                # the window contents were lost (uncovered, shown, restored), present the whole frame again
+                self.damage_all()
 
             if event.type == sdl.SDL_QUIT:
                 return 0
 
-    @staticmethod
-    def cap_framerate(start, end, fps):
-        frame_delta = 1 / fps
-        dt = frame_delta - (end - start)
-        if dt > 0:
-            sleep(dt)
-        return dt
-
     def main_loop(self):
         self.update()
 
-        init_time = time()
+        clock = self.clock
+        clock.start()
+        event = sdl.SDL_Event()
 
         while True:
-            start = time() - init_time
+            stats = self.frame_stats
+            if stats:
+                stats.begin_frame()
 
             # Event loop
-            event = sdl.SDL_Event()
             if self.event_loop(event) == 0:
                 self.handle_quit()
                 return
+            if stats:
+                stats.mark("events")
+
+            for _ in range(clock.updates_due()):
+                if self.frame_updater:
+                    self.frame_updater(clock.dt)
+            if stats:
+                stats.mark("updates")
 
-            if self.frame_renderer:
-                with self.skia_surface as canvas:
-                    canvas: skia.Canvas
-                    self.frame_renderer(canvas, time() - init_time)
-                    self.update()
+            if self.frame_renderer and clock.should_render():
+                render_frame(self, lambda canvas: self.frame_renderer(canvas, clock.simulation_time))
+            if stats:
+                stats.end_frame()  # the sleep below is not part of the frame time
 
             # Frame
-            end = time() - init_time
-            self.cap_framerate(start, end, fps)
+            clock.wait()
+            if stats:
+                stats.mark("sleep")
 
     def handle_resize(self, event):
         self.width = event.window.data1
         self.height = event.window.data2
         # Create a new skia surface from the updated dimensions (required so no segfaults occur)
-        self.skia_surface = self.__create_skia_surface()
+        self.skia_surface = self.create_skia_surface()
         self.update()
 
-    # noinspection PyMethodMayBeStatic
     def handle_quit(self):
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
         sdl.SDL_Quit()
         print("Quiting...")
 
@@ -1,4 +1,5 @@
 from lib.mathematical_land import Cube, Vector, Square3D
+from lib.scene_graph import Scene, SceneNode
 from lib.ui_backend import Window
 from skia import Canvas, Color
 
@@ -12,25 +13,41 @@ base_plane = Square3D(
 )
 
 
-def event_loop(canvas: Canvas, event):
-    canvas.drawColor(Color(0, 0, 0))
+scene = Scene()
+cube_node = scene.add(SceneNode(main_cube, stroke_width=3, stroke_color=Color(0, 255, 0)))
+plane_node = scene.add(SceneNode(base_plane, stroke_width=1, stroke_color=Color(255, 0, 0)))
+
+
+def rotate(x_step, y_step):
+    # the plane turns against the cube
+    cube_node.modify(x_rotation=main_cube.x_rotation + x_step, y_rotation=main_cube.y_rotation + y_step)
+    plane_node.modify(x_rotation=base_plane.x_rotation - x_step, y_rotation=base_plane.y_rotation - y_step)
+
 
+def handle_event(event):
     if event.window.data1 == 79:
-        main_cube.y_rotation += .05
-        base_plane.y_rotation -= .05
+        rotate(0, .05)
     elif event.window.data1 == 80:
-        main_cube.y_rotation -= .05
-        base_plane.y_rotation += .05
+        rotate(0, -.05)
     elif event.window.data1 == 82:
-        main_cube.x_rotation += .05
-        base_plane.x_rotation -= .05
+        rotate(.05, 0)
     elif event.window.data1 == 81:
-        main_cube.x_rotation -= .05
-        base_plane.x_rotation += .05
+        rotate(-.05, 0)
+    else:
+        return False
+    return True
 
-    main_cube.paint(canvas, 3, Color(0, 255, 0))
-    base_plane.paint(canvas, 1, Color(255, 0, 0))
+
+def frame_renderer(canvas: Canvas, time=0.0):
+    canvas.drawColor(Color(0, 0, 0))
+    scene.paint(canvas)
+
+
+def event_loop(canvas: Canvas, event):
+    handle_event(event)
+    frame_renderer(canvas)
 
 
-window = Window("Simple Cube", 1000, 1000, event_loop=event_loop)
-window.start()
+if __name__ == "__main__":
+    window = Window("Simple Cube", 1000, 1000, event_handler=handle_event, frame_renderer=frame_renderer)
+    window.start()
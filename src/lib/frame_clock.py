@@ -0,0 +1,115 @@
+from collections import deque
+from math import floor
+from time import perf_counter, sleep
+
+# Sleeping is only accurate to a fraction of a millisecond, the last stretch before a deadline is spun instead.
+SPIN_MARGIN = 0.0005
+
+
+class FrameClock:
+    """
+    Deadline based frame pacing on the monotonic perf_counter clock. Frame k is due at start + k * period, so
+    overrunning frames never push later frames back and long animations keep wall clock accuracy. Simulation updates
+    run at a fixed timestep decoupled from rendering, and rendering is skipped (at most max_frame_skip times in a row)
+    while the loop is behind schedule.
+    """
+
+    def __init__(self, fps=60, update_rate=None, max_updates=5, max_frame_skip=5, window=240):
+        self.period = 1 / fps
+        self.dt = 1 / (update_rate or fps)
+        self.max_updates = max_updates
+        self.max_frame_skip = max_frame_skip
+
+        self.start_time = self.last_time = self.deadline = None
+        self.accumulator = 0.0
+
+        self.frames = 0
+        self.updates = 0
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+        self.consecutive_skips = 0
+        self.missed_deadlines = 0
+        self.skipped_slots = 0  # frame slots the schedule jumped over after missed deadlines
+        self.dropped_updates = 0
+        self.jitter = deque(maxlen=window)  # seconds between a frame deadline and the actual wake up
+
+    def start(self):
+        self.start_time = self.last_time = perf_counter()
+        self.deadline = self.start_time + self.period
+        self.accumulator = 0.0
+
+    @property
+    def simulation_time(self):
+        return self.updates * self.dt
+
+    @property
+    def elapsed(self):
+        return perf_counter() - self.start_time
+
+    def updates_due(self) -> int:
+        """
+        Number of fixed timestep updates to run this frame. Under heavy load at most max_updates are run, the rest is
+        dropped instead of piling up.
+        """
+        now = perf_counter()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        count = floor(self.accumulator / self.dt)
+        self.accumulator -= count * self.dt
+        if count > self.max_updates:
+            self.dropped_updates += count - self.max_updates
+            count = self.max_updates
+        self.updates += count
+        return count
+
+    def should_render(self) -> bool:
+        # Skip painting while the frame is already past its deadline, but never more than max_frame_skip in a row.
+        if perf_counter() > self.deadline and self.consecutive_skips < self.max_frame_skip:
+            self.consecutive_skips += 1
+            self.skipped_frames += 1
+            return False
+        self.consecutive_skips = 0
+        self.rendered_frames += 1
+        return True
+
+    def wait(self):
+        """
+        Sleeps until the next frame is due. A frame that already missed its deadline starts right away and the
+        schedule moves on to the next deadline still ahead.
+        """
+        now = perf_counter()
+        if now >= self.deadline:
+            self.missed_deadlines += 1
+            self.jitter.append(now - self.deadline)
+            next_slot = floor((now - self.start_time) / self.period) + 1
+            # slots between the missed deadline and the next one ahead, none of them gets a frame
+            self.skipped_slots += max(next_slot - round((self.deadline - self.start_time) / self.period) - 1, 0)
+            self.deadline = self.start_time + next_slot * self.period
+        else:
+            remaining = self.deadline - now
+            if remaining > SPIN_MARGIN:
+                sleep(remaining - SPIN_MARGIN)
+            while perf_counter() < self.deadline:
+                pass
+            self.jitter.append(perf_counter() - self.deadline)
+            self.deadline += self.period
+        self.frames += 1
+
+    def summary(self):
+        jitter_ms = sorted(1000 * sample for sample in self.jitter)
+        return {
+            "frames": self.frames,
+            "rendered_frames": self.rendered_frames,
+            "skipped_frames": self.skipped_frames,
+            "missed_deadlines": self.missed_deadlines,
+            "updates": self.updates,
+            "dropped_updates": self.dropped_updates,
+            "skipped_slots": self.skipped_slots,
+            # how far the clock is from the schedule, skipped slots keep the schedule aligned and are not drift
+            "drift_ms": 1000 * (self.elapsed - (self.frames + self.skipped_slots) * self.period)
+            if self.start_time else 0.0,
+            "jitter_mean_ms": sum(jitter_ms) / len(jitter_ms) if jitter_ms else 0.0,
+            "jitter_p95_ms": jitter_ms[min(len(jitter_ms) - 1, int(len(jitter_ms) * 0.95))] if jitter_ms else 0.0,
+            "jitter_max_ms": jitter_ms[-1] if jitter_ms else 0.0,
+        }
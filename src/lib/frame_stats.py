@@ -0,0 +1,119 @@
+import atexit
+import json
+from bisect import bisect_left
+from collections import deque
+from time import perf_counter
+
+import skia
+
+# Upper edges (in milliseconds) of the histogram buckets, the last bucket catches everything slower.
+HISTOGRAM_EDGES_MS = (1, 2, 4, 8, 16.7, 33.3, 50, 100)
+
+
+class FrameStats:
+    """
+    Per phase frame timings kept over a rolling window of frames. The window backends call begin_frame() once per
+    frame, mark(phase) after every phase (each mark records the time since the previous one) and end_frame() once the
+    frame was presented. Frame times only cover begin_frame() to end_frame(), idle time waiting for events between
+    frames only shows up in fps, which is computed from the frame start times.
+    """
+
+    def __init__(self, window=240, overlay=False, dump_path=None):
+        self.window = window
+        self.overlay = overlay
+        self.dump_path = dump_path
+
+        self.phases = {}  # phase name -> deque of durations in seconds
+        self.counters = {}  # counter name -> deque of per frame values
+        self.frame_times = deque(maxlen=window)  # begin_frame() to end_frame()
+        self.frame_starts = deque(maxlen=window)
+        self.frames = 0
+        self.frame_start = None
+        self.last_mark = None
+
+        self.overlay_paint = skia.Paint(Color=skia.Color(255, 255, 255), AntiAlias=True)
+        self.overlay_background = skia.Paint(Color=skia.Color(0, 0, 0, 160))
+        self.overlay_font = skia.Font(None, 14)
+        self.overlay_rect = (0, 0, 170, 24)  # x, y, width, height
+
+        if dump_path is not None:
+            atexit.register(self.dump)
+
+    def begin_frame(self):
+        now = perf_counter()
+        self.frame_starts.append(now)
+        self.frame_start = self.last_mark = now
+        self.frames += 1
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return  # outside of a frame
+        self.frame_times.append(perf_counter() - self.frame_start)
+        self.frame_start = None
+
+    def mark(self, phase):
+        if self.last_mark is None:
+            return  # outside of a frame
+        now = perf_counter()
+        if phase not in self.phases:
+            self.phases[phase] = deque(maxlen=self.window)
+        self.phases[phase].append(now - self.last_mark)
+        self.last_mark = now
+
+    def record(self, counter, value):
+        if counter not in self.counters:
+            self.counters[counter] = deque(maxlen=self.window)
+        self.counters[counter].append(value)
+
+    @property
+    def fps(self):
+        # frames started per second over the window, including idle time between frames
+        if len(self.frame_starts) < 2:
+            return 0.0
+        span = self.frame_starts[-1] - self.frame_starts[0]
+        return (len(self.frame_starts) - 1) / span if span else 0.0
+
+    @property
+    def frame_time_ms(self):
+        return 1000 * sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    @staticmethod
+    def describe(samples):
+        samples_ms = sorted(1000 * sample for sample in samples)
+        if not samples_ms:
+            return {}
+        histogram = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        for sample in samples_ms:
+            histogram[bisect_left(HISTOGRAM_EDGES_MS, sample)] += 1
+        return {
+            "mean_ms": sum(samples_ms) / len(samples_ms),
+            "p50_ms": samples_ms[len(samples_ms) // 2],
+            "p95_ms": samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.95))],
+            "max_ms": samples_ms[-1],
+            "histogram": histogram,
+        }
+
+    def summary(self):
+        return {
+            "frames": self.frames,
+            "fps": self.fps,
+            "histogram_edges_ms": HISTOGRAM_EDGES_MS,
+            "frame": self.describe(self.frame_times),
+            "phases": {phase: self.describe(samples) for phase, samples in self.phases.items()},
+            "counters": {
+                counter: {"mean": sum(values) / len(values), "max": max(values)}
+                for counter, values in self.counters.items() if values
+            },
+        }
+
+    def dump(self, path=None):
+        path = path or self.dump_path
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def paint_overlay(self, canvas: skia.Canvas):
+        if not self.overlay:
+            return
+        text = f"{self.fps:5.1f} fps  {self.frame_time_ms:6.2f} ms"
+        canvas.drawRect(skia.Rect.MakeXYWH(*self.overlay_rect), self.overlay_background)
+        canvas.drawString(text, 6, 17, self.overlay_font, self.overlay_paint)
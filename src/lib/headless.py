@@ -0,0 +1,248 @@
+import os
+import struct
+from types import SimpleNamespace
+
+import numpy as np
+import skia
+
+# SDL scancodes read by the demo event loops (through event.window.data1)
+KEY_RIGHT, KEY_LEFT, KEY_DOWN, KEY_UP = 79, 80, 81, 82
+SDL_KEYDOWN = 0x300
+
+
+class HeadlessEvent:
+    """
+    Stands in for an SDL_Event, exposing the fields the event loops read. For keyboard events SDL stores the scancode
+    where window.data1 lives, which is why the demos read it from there.
+    """
+
+    def __init__(self, scancode=0, type_=SDL_KEYDOWN):
+        self.type = type_
+        self.window = SimpleNamespace(event=0, data1=scancode, data2=0)
+        self.key = SimpleNamespace(keysym=SimpleNamespace(scancode=scancode))
+
+    def __repr__(self):
+        return f"HeadlessEvent({self.window.data1})"
+
+
+def key_presses(scancode, count):
+    for _ in range(count):
+        yield HeadlessEvent(scancode)
+
+
+class HeadlessWindow:
+    """
+    Drives the same event_loop(canvas, event) / frame_renderer(canvas, time) callbacks as the SDL Window classes
+    against an offscreen raster surface, no display needed.
+    """
+
+    def __init__(self, width, height, event_loop=None, background=skia.ColorWHITE):
+        self.width = width
+        self.height = height
+        self.event_loop = event_loop
+        self.frame_renderer = None
+
+        surface_blueprint = skia.ImageInfo.Make(
+            self.width, self.height,
+            ct=skia.kRGBA_8888_ColorType,
+            at=skia.kUnpremul_AlphaType
+        )
+        # noinspection PyArgumentList
+        self.skia_surface = skia.Surface.MakeRaster(surface_blueprint)
+        with self.skia_surface as canvas:
+            canvas.drawColor(background)
+
+    def render_frame(self, event, time):
+        with self.skia_surface as canvas:
+            if self.event_loop is not None:
+                self.event_loop(canvas, event)
+            if self.frame_renderer is not None:
+                self.frame_renderer(canvas, time)
+
+    def frames(self, events=None, count=None, fps=60):
+        """
+        Yields one image per rendered frame. Frames are rendered lazily, so consumers that encode and drop each image
+        keep memory flat no matter how many frames are produced. Stops after `count` frames or when `events` (an
+        iterable of HeadlessEvents or scancodes) runs out.
+        """
+        if events is None and count is None:
+            raise ValueError("either events or count is required")
+
+        events = iter(events if events is not None else ())
+        index = 0
+        while count is None or index < count:
+            event = next(events, None)
+            if event is None:
+                if count is None:
+                    return
+                event = HeadlessEvent()
+            elif isinstance(event, int):
+                event = HeadlessEvent(event)
+
+            self.render_frame(event, index / fps)
+            yield self.skia_surface.makeImageSnapshot()
+            index += 1
+
+    def export(self, path, events=None, count=None, fps=60):
+        """
+        Renders straight to disk, a path ending in .gif becomes an animated GIF, anything else is used as the
+        directory of a PNG sequence. Returns the number of frames written.
+        """
+        frames = self.frames(events, count, fps)
+        if path.lower().endswith(".gif"):
+            return write_gif(frames, path, self.width, self.height, fps)
+        return write_png_sequence(frames, path)
+
+
+def encode_png(image: skia.Image) -> bytes:
+    return bytes(image.encodeToData(skia.kPNG, 100))
+
+
+def write_png_sequence(frames, directory, name="frame_{:05d}.png"):
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        if isinstance(frame, skia.Image):
+            frame = encode_png(frame)
+        with open(os.path.join(directory, name.format(count - 1)), "wb") as file:
+            file.write(frame)
+    return count
+
+
+# ---------- GIF ENCODING ----------
+# Frames are quantized to a fixed 3-3-2 RGB palette, so every frame shares the global color table and can be encoded
+# independently of the others.
+GIF_PALETTE = bytes(
+    channel
+    for index in range(256)
+    for channel in (((index >> 5) & 7) * 255 // 7, ((index >> 2) & 7) * 255 // 7, (index & 3) * 255 // 3)
+)
+LZW_MIN_CODE_SIZE = 8
+LZW_MAX_CODE = 4095
+
+
+def quantize(pixels: np.ndarray) -> bytes:
+    """
+    Maps an (height, width, 4) RGBA array to palette indices.
+    """
+    r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+    return ((r & 0xE0) | ((g & 0xE0) >> 3) | (b >> 6)).astype(np.uint8).tobytes()
+
+
+def lzw_encode(indices: bytes) -> bytes:
+    clear_code = 1 << LZW_MIN_CODE_SIZE
+    end_code = clear_code + 1
+    output = bytearray()
+    bit_buffer, bit_count = 0, 0
+
+    code_size = LZW_MIN_CODE_SIZE + 1
+    next_code = end_code + 1
+    table = {}
+
+    # emit clear code
+    bit_buffer |= clear_code << bit_count
+    bit_count += code_size
+
+    prefix = indices[0]
+    for index in indices[1:]:
+        key = (prefix << 8) | index
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+
+        bit_buffer |= prefix << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            output.append(bit_buffer & 0xFF)
+            bit_buffer >>= 8
+            bit_count -= 8
+
+        if next_code <= LZW_MAX_CODE:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            # table full, start over
+            bit_buffer |= clear_code << bit_count
+            bit_count += code_size
+            table.clear()
+            code_size = LZW_MIN_CODE_SIZE + 1
+            next_code = end_code + 1
+
+        prefix = index
+
+    for code in (prefix, end_code):
+        bit_buffer |= code << bit_count
+        bit_count += code_size
+    while bit_count > 0:
+        output.append(bit_buffer & 0xFF)
+        bit_buffer >>= 8
+        bit_count -= 8
+
+    return bytes(output)
+
+
+def encode_gif_frame(pixels: np.ndarray, delay: int) -> bytes:
+    """
+    Encodes an (height, width, 4) RGBA array as a complete GIF frame (graphic control extension, image descriptor and
+    image data), `delay` is in hundredths of a second.
+    """
+    height, width = pixels.shape[:2]
+    data = lzw_encode(quantize(pixels))
+
+    frame = bytearray(b"\x21\xF9\x04\x00" + struct.pack("<H", delay) + b"\x00\x00")
+    frame += b"\x2C" + struct.pack("<HHHH", 0, 0, width, height) + b"\x00"
+    frame.append(LZW_MIN_CODE_SIZE)
+    for start in range(0, len(data), 255):
+        block = data[start:start + 255]
+        frame.append(len(block))
+        frame += block
+    frame.append(0)
+    return bytes(frame)
+
+
+class GifWriter:
+    """
+    Streams an animated GIF to a file one frame at a time.
+    """
+
+    def __init__(self, path, width, height, fps=60, loop=0):
+        self.width = width
+        self.height = height
+        self.delay = max(1, round(100 / fps))
+        self.file = open(path, "wb")
+
+        header = b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0) + GIF_PALETTE
+        header += b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00"
+        self.file.write(header)
+
+    def write(self, frame):
+        """
+        Accepts a skia.Image, an RGBA array or a frame already encoded with encode_gif_frame.
+        """
+        if isinstance(frame, skia.Image):
+            frame = frame.toarray()
+        if isinstance(frame, np.ndarray):
+            frame = encode_gif_frame(frame, self.delay)
+        self.file.write(frame)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.write(b"\x3B")
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def write_gif(frames, path, width, height, fps=60, loop=0):
+    count = 0
+    with GifWriter(path, width, height, fps, loop) as gif:
+        for count, frame in enumerate(frames, 1):
+            gif.write(frame)
+    return count
@@ -1,11 +1,41 @@
-from math import sqrt, sin, cos, pi
+from functools import lru_cache
+from math import sqrt, sin, cos, pi, acos, ceil
 
 import numpy as np
-from scipy.linalg import expm, norm
-from skia import Canvas, Color, Paint
+from skia import Canvas, Color, ColorSetA, Paint, Point
+
+from .paint_registry import shared_paint
+
+# Submit every primitive's edges through one drawPoints call instead of one drawLine per edge,
+# set to False to compare against the per-line path.
+BATCH_DRAW_CALLS = True
+
+# Unit circle / sphere templates are shared between every instance with the same orientation, rotations are rounded to
+# TEMPLATE_PRECISION decimals before being used as cache keys.
+TEMPLATE_CACHE_SIZE = 512
+TEMPLATE_PRECISION = 9
+
+# Optional culling of edges facing away from the viewer: CULL_SKIP drops them, CULL_DIM draws them with the stroke's
+# alpha scaled by HIDDEN_EDGE_ALPHA. The demos look down +z (the perspective eye sits at negative z).
+CULL_SKIP = "skip"
+CULL_DIM = "dim"
+HIDDEN_EDGE_ALPHA = 0.25
+VIEW_DIRECTION = (0, 0, 1)
+
+# Level of detail: circles get just enough segments for every chord to stay within LOD_PIXEL_ERROR pixels of the true
+# circle, sphere wires are kept about LOD_WIRE_SPACING pixels apart. A level is only re-chosen once the projected
+# radius moved more than LOD_HYSTERESIS (relative) away from the radius it was chosen at, so shapes don't pop.
+LOD_PIXEL_ERROR = 0.5
+LOD_MIN_SEGMENTS = 8
+LOD_MAX_SEGMENTS = 256
+LOD_WIRE_SPACING = 12
+LOD_HYSTERESIS = 0.2
 
 
 class Vector:
+    # No per instance __dict__, a Vector is just its three floats.
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x=0.0, y=0.0, z=0.0):
         self.x = float(x)
         self.y = float(y)
@@ -13,7 +43,7 @@ class Vector:
 
     @property
     def length(self):
-        return sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
     @property
     def xy(self):
@@ -28,14 +58,20 @@ class Vector:
         return self.x, self.y, self.z
 
     def scale(self, scalar):
-        scaled = Vector(self.x, self.y, self.z)
-        scaled.x *= scalar
-        scaled.y *= scalar
-        scaled.z *= scalar
-        return scaled
+        return Vector(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def scale_(self, scalar):
+        # in place version of scale
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
 
     def len(self):
-        return sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
 
     def __add__(self, other):
         return Vector(
@@ -44,6 +80,12 @@ class Vector:
             self.z + other.z
         )
 
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
     def __sub__(self, other):
         return Vector(
             self.x - other.x,
@@ -51,11 +93,19 @@ class Vector:
             self.z - other.z
         )
 
+    def __isub__(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
     def __mul__(self, other):
-        return Vector(*np.cross(
-            np.array(self.xyz),
-            np.array(other.xyz)
-        ))
+        # cross product, written out for three floats instead of going through np.cross
+        return Vector(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x
+        )
 
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y and self.z == other.z
@@ -70,7 +120,249 @@ class Vector:
         return f"Vec({self.x}, {self.y}, {self.z})"
 
 
-class Square3D:
+def rotation_matrix(axis: Vector, theta: float) -> np.ndarray:
+    # Closed form (Rodrigues) rotation matrix about an arbitrary axis, equivalent to expm of the axis' cross matrix.
+    x, y, z = np.array(axis.xyz) / axis.len()
+    cross = np.array((
+        (0, -z, y),
+        (z, 0, -x),
+        (-y, x, 0),
+    ))
+    return np.eye(3) + sin(theta) * cross + (1 - cos(theta)) * (cross @ cross)
+
+
+def rotate_about_axis(vector: Vector, axis: Vector, thetas) -> np.ndarray:
+    """
+    Rotates a single vector about an axis by every angle in `thetas` in one vectorized step (Rodrigues' formula),
+    returns an array with one row per angle.
+    """
+    thetas = np.asarray(thetas, dtype=float).reshape(-1, 1)
+    v = np.array(vector.xyz)
+    k = np.array(axis.xyz) / axis.len()
+    return v * np.cos(thetas) + np.cross(k, v) * np.sin(thetas) + k * (k @ v) * (1 - np.cos(thetas))
+
+
+class VertexBuffer:
+    """
+    Stores a batch of vertices as one contiguous N x 3 float array, so translations and rotations are applied to every
+    vertex at once instead of allocating a new Vector per point.
+    """
+
+    def __init__(self, data=None):
+        if data is None:
+            data = np.empty((0, 3))
+        self.data = np.asarray(data, dtype=float).reshape(-1, 3)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        return cls([vector.xyz for vector in vectors])
+
+    @classmethod
+    def concatenate(cls, buffers):
+        buffers = list(buffers)
+        if not buffers:
+            return cls()
+        return cls(np.concatenate([buffer.data for buffer in buffers]))
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self.data[:, :2]
+
+    def copy(self) -> "VertexBuffer":
+        return VertexBuffer(self.data.copy())
+
+    def translate(self, offset: Vector) -> "VertexBuffer":
+        self.data += offset.xyz
+        return self
+
+    def scale(self, scalar: float, center: Vector = None) -> "VertexBuffer":
+        if center is None:
+            self.data *= scalar
+        else:
+            self.data -= center.xyz
+            self.data *= scalar
+            self.data += center.xyz
+        return self
+
+    def transform(self, matrix: np.ndarray, center: Vector = None) -> "VertexBuffer":
+        # Applies a 3x3 linear transform to every vertex, optionally about a pivot point.
+        if center is not None:
+            self.data -= center.xyz
+        self.data[:] = self.data @ np.asarray(matrix).T
+        if center is not None:
+            self.data += center.xyz
+        return self
+
+    def rotate(self, axis: Vector, theta: float, center: Vector = None) -> "VertexBuffer":
+        return self.transform(rotation_matrix(axis, theta), center)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index) -> Vector:
+        return Vector(*self.data[index])
+
+    def __iter__(self):
+        for x, y, z in self.data:
+            yield Vector(x, y, z)
+
+    def __repr__(self):
+        return f"VertexBuffer({len(self)} vertices)"
+
+
+def closed_loop_edges(count: int, offset: int = 0) -> np.ndarray:
+    # Index pairs joining `count` consecutive vertices into a closed polygon.
+    start = np.arange(count) + offset
+    return np.column_stack((start, np.roll(start, -1)))
+
+
+def draw_edges(canvas: Canvas, vertices: VertexBuffer, edges: np.ndarray, paint: Paint, batched: bool = None):
+    if batched is None:
+        batched = BATCH_DRAW_CALLS
+
+    if batched:
+        # one Point per unique vertex, shared by every edge end point indexing it
+        points = [Point(x, y) for x, y in vertices.xy.tolist()]
+        canvas.drawPoints(Canvas.kLines_PointMode, [points[i] for i in np.asarray(edges).ravel().tolist()], paint)
+        return
+
+    points = vertices.xy.tolist()
+    for p1, p2 in np.asarray(edges).tolist():
+        canvas.drawLine(*points[p1], *points[p2], paint)
+
+
+def draw_culled_edges(canvas: Canvas, vertices: VertexBuffer, edges: np.ndarray, visible: np.ndarray, paint: Paint,
+                      cull: str = None):
+    # visible holds one bool per edge, hidden edges are drawn first (dimmed) so visible ones stay on top
+    if cull is None:
+        draw_edges(canvas, vertices, edges, paint)
+        return
+    if cull not in (CULL_SKIP, CULL_DIM):
+        raise ValueError(f"unknown cull mode {cull!r}, expected None, {CULL_SKIP!r} or {CULL_DIM!r}")
+
+    if cull == CULL_DIM and not visible.all():
+        hidden_color = ColorSetA(paint.getColor(), round(paint.getAlpha() * HIDDEN_EDGE_ALPHA))
+        hidden_paint = shared_paint(hidden_color, paint.getStrokeWidth(), paint.getStyle(), paint.isAntiAlias())
+        draw_edges(canvas, vertices, edges[~visible], hidden_paint)
+    if visible.any():
+        draw_edges(canvas, vertices, edges[visible], paint)
+
+
+def translation_matrix(offset: Vector) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, 3] = offset.xyz
+    return matrix
+
+
+def affine_matrix(linear: np.ndarray, center: Vector = None) -> np.ndarray:
+    # 4x4 homogeneous form of a 3x3 linear transform, optionally applied about a pivot point.
+    matrix = np.eye(4)
+    matrix[:3, :3] = linear
+    if center is not None:
+        pivot = np.array(center.xyz)
+        matrix[:3, 3] = pivot - np.asarray(linear) @ pivot
+    return matrix
+
+
+def apply_matrix(matrix: np.ndarray, vertices: VertexBuffer) -> VertexBuffer:
+    """
+    Applies a 4x4 homogeneous transform to every vertex at once, dividing by w, and returns a new buffer.
+    """
+    data = vertices.data @ matrix[:3, :3].T + matrix[:3, 3]
+    w = vertices.data @ matrix[3, :3] + matrix[3, 3]
+    return VertexBuffer(data / w[:, None])
+
+
+class Camera:
+    """
+    Perspective camera for the demos: rays from the eye through each vertex are intersected with the z = 0 screen
+    plane. The projection is one 4x4 matrix, so a mesh's unique vertices are projected together
+    (model-view-projection) instead of per edge end point.
+    """
+
+    def __init__(self, eye: Vector, view: np.ndarray = None):
+        self.eye = eye
+        self.view = np.eye(4) if view is None else view
+
+    @property
+    def projection_matrix(self) -> np.ndarray:
+        # projected x = (x * -z_e + z * x_e) / (z - z_e), same for y, projected z = 0
+        x_e, y_e, z_e = self.eye.xyz
+        return np.array((
+            (-z_e, 0, x_e, 0),
+            (0, -z_e, y_e, 0),
+            (0, 0, 0, 0),
+            (0, 0, 1, -z_e),
+        ))
+
+    def mvp(self, model: np.ndarray = None) -> np.ndarray:
+        matrix = self.projection_matrix @ self.view
+        return matrix if model is None else matrix @ model
+
+    def project(self, vertices: VertexBuffer, model: np.ndarray = None) -> VertexBuffer:
+        return apply_matrix(self.mvp(model), vertices)
+
+    def projected_radius(self, center: Vector, radius: float) -> float:
+        # on-screen size of a radius at the depth of center, for LevelOfDetail
+        return abs(radius * self.eye.z / (center.z - self.eye.z))
+
+
+class Mesh:
+    """
+    Indexed line mesh: every unique vertex once, plus an (n, 2) array of vertex index pairs with one row per edge.
+    """
+
+    def __init__(self, vertices: VertexBuffer, edges: np.ndarray):
+        self.vertices = vertices
+        self.edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+
+    def freeze(self) -> "Mesh":
+        # cached meshes are shared, transform a .copy() of the vertices instead
+        self.vertices.data.flags.writeable = False
+        self.edges.flags.writeable = False
+        return self
+
+    def paint(self, canvas: Canvas, paint: Paint):
+        draw_edges(canvas, self.vertices, self.edges, paint)
+
+    def __repr__(self):
+        return f"Mesh({len(self.vertices)} vertices, {len(self.edges)} edges)"
+
+
+class CachedMesh:
+    """
+    Builds a shape's Mesh lazily and reuses it for as long as mesh_key (rotations, size, origin) stays the same, so
+    painting an unchanged shape does no geometry work at all.
+    """
+    cached_mesh = None
+    cached_mesh_key = None
+
+    @property
+    def mesh_key(self) -> tuple:
+        raise NotImplementedError
+
+    def build_mesh(self) -> Mesh:
+        raise NotImplementedError
+
+    @property
+    def mesh(self) -> Mesh:
+        key = self.mesh_key
+        if key != self.cached_mesh_key:
+            self.cached_mesh = self.build_mesh().freeze()
+            self.cached_mesh_key = key
+        return self.cached_mesh
+
+    @property
+    def vertices(self) -> VertexBuffer:
+        # a copy callers may transform in place, painting reads the frozen self.mesh.vertices instead
+        return self.mesh.vertices.copy()
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self.mesh.edges
+
+
+class Square3D(CachedMesh):
     def __init__(self, top_left: Vector, x_rotation: float, y_rotation: float, side: float):
         self.top_left = top_left
         self.x_rotation = float(x_rotation)
@@ -93,11 +385,13 @@ class Square3D:
     @property
     def bottom_right(self) -> Vector:
         partial_length = self.side * sin(self.x_rotation)
-        return self.top_right + Vector(
+        corner = self.top_right
+        corner += Vector(
             y=self.side * cos(self.x_rotation),
             x=-partial_length * sin(self.y_rotation),
             z=-partial_length * cos(self.y_rotation)
         )
+        return corner
 
     @property
     def points(self) -> tuple:
@@ -108,18 +402,28 @@ class Square3D:
             self.bottom_left
         )
 
+    @property
+    def mesh_key(self) -> tuple:
+        return self.x_rotation, self.y_rotation, self.side, self.top_left.xyz
+
+    def build_mesh(self) -> Mesh:
+        return Mesh(self.corner_vertices(), closed_loop_edges(4))
+
+    def corner_vertices(self) -> VertexBuffer:
+        # Same corners as .points (top left, top right, bottom right, bottom left) computed in a single array.
+        across = np.array((self.side * cos(self.y_rotation), 0, self.side * sin(self.y_rotation)))
+        partial_length = self.side * sin(self.x_rotation)
+        down = np.array((
+            -partial_length * sin(self.y_rotation),
+            self.side * cos(self.x_rotation),
+            -partial_length * cos(self.y_rotation)
+        ))
+        corners = np.array(((0, 0, 0), across, across + down, down)) + self.top_left.xyz
+        return VertexBuffer(corners)
+
     def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color):
-        points = self.points
-        paint = Paint(
-            Color=stroke_color,
-            StrokeWidth=stroke_width
-        )
-        for i in range(len(points)):
-            canvas.drawLine(
-                *points[i].xy,
-                *points[(i + 1) % len(points)].xy,
-                paint
-            )
+        paint = shared_paint(stroke_color, stroke_width)
+        self.mesh.paint(canvas, paint)
 
     def __repr__(self):
         return f"[Origin: {self.top_left}," \
@@ -128,7 +432,7 @@ class Square3D:
                f" Bottom Right: {self.bottom_right}]"
 
 
-class Cube:
+class Cube(CachedMesh):
     def __init__(self, front_top_left: Vector, x_rotation: float, y_rotation: float, side: float):
         self.front_top_left = front_top_left
         self.x_rotation = float(x_rotation)
@@ -150,22 +454,50 @@ class Cube:
 
     @property
     def plane_joining_points(self):
-        return (
-            (self.front_plane.top_left, self.back_plane.top_left),
-            (self.front_plane.top_right, self.back_plane.top_right),
-            (self.front_plane.bottom_right, self.back_plane.bottom_right),
-            (self.front_plane.bottom_left, self.back_plane.bottom_left),
-        )
+        # front plane corner -> matching back plane corner, read off the cached mesh
+        vertices = self.mesh.vertices
+        return tuple((vertices[i], vertices[i + 4]) for i in range(4))
 
-    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color):
-        self.front_plane.paint(canvas, stroke_width, stroke_color)
-        self.back_plane.paint(canvas, stroke_width, stroke_color)
-        paint = Paint(
-            Color=stroke_color,
-            StrokeWidth=stroke_width
-        )
-        for p1, p2 in self.plane_joining_points:
-            canvas.drawLine(p1.xy, p2.xy, paint)
+    @property
+    def mesh_key(self) -> tuple:
+        return self.x_rotation, self.y_rotation, self.side, self.front_top_left.xyz
+
+    def build_mesh(self) -> Mesh:
+        # Front plane corners followed by the back plane corners, both in Square3D.points order.
+        front = self.front_plane.corner_vertices().data
+        depth = np.array((
+            self.side * cos(self.x_rotation) * sin(self.y_rotation),
+            self.side * sin(self.x_rotation),
+            self.side * cos(self.x_rotation) * cos(self.y_rotation),
+        ))
+        edges = np.concatenate((
+            closed_loop_edges(4),
+            closed_loop_edges(4, offset=4),
+            np.column_stack((np.arange(4), np.arange(4) + 4)),
+        ))
+        return Mesh(VertexBuffer(np.concatenate((front, front + depth))), edges)
+
+    def face_normals(self) -> np.ndarray:
+        # Outward unit normal of every face in CUBE_FACES order.
+        vertices = self.mesh.vertices.data
+        corners = vertices[CUBE_FACES]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 3] - corners[:, 0])
+        outward = np.einsum("ij,ij->i", normals, corners.mean(axis=1) - vertices.mean(axis=0))
+        normals[outward < 0] *= -1
+        return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    def visible_edges(self, view=VIEW_DIRECTION) -> np.ndarray:
+        # An edge is visible when at least one of its two faces points towards the viewer.
+        facing = self.face_normals() @ np.asarray(view, dtype=float) < 0
+        return facing[CUBE_EDGE_FACES].any(axis=1)
+
+    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color, cull: str = None):
+        paint = shared_paint(stroke_color, stroke_width)
+        if cull is None:
+            self.mesh.paint(canvas, paint)
+        else:
+            mesh = self.mesh
+            draw_culled_edges(canvas, mesh.vertices, mesh.edges, self.visible_edges(), paint, cull)
     #
     # @property
     # def p1(self):
@@ -200,13 +532,84 @@ class Cube:
     #     return self.back_plane.bottom_right
 
 
+# Vertex indices of the cube's faces (front, back, top, bottom, left, right), each in loop order, and the two faces
+# sharing every edge of Cube.edges.
+CUBE_FACES = np.array((
+    (0, 1, 2, 3),
+    (4, 5, 6, 7),
+    (0, 1, 5, 4),
+    (3, 2, 6, 7),
+    (0, 3, 7, 4),
+    (1, 2, 6, 5),
+))
+CUBE_EDGE_FACES = np.array([
+    [face for face, corners in enumerate(CUBE_FACES.tolist()) if start in corners and end in corners]
+    for start, end in Cube(Vector(), 0, 0, 1).edges.tolist()
+])
+
+
+def segments_for_radius(radius: float, pixel_error: float = LOD_PIXEL_ERROR) -> int:
+    # A chord spanning angle a deviates radius * (1 - cos(a / 2)) from the arc, solved for the segment count.
+    if radius <= pixel_error:
+        return LOD_MIN_SEGMENTS
+    segments = ceil(pi / acos(1 - pixel_error / radius))
+    return min(max(segments, LOD_MIN_SEGMENTS), LOD_MAX_SEGMENTS)
+
+
+class LevelOfDetail:
+    """
+    Per shape level of detail state: picks the circle segment count and the sphere wire gap from the projected on-screen
+    radius (in pixels), keeping the current level until the radius leaves the hysteresis band around the radius it was
+    picked at.
+    """
+
+    def __init__(self, pixel_error=LOD_PIXEL_ERROR, wire_spacing=LOD_WIRE_SPACING, hysteresis=LOD_HYSTERESIS):
+        self.pixel_error = pixel_error
+        self.wire_spacing = wire_spacing
+        self.hysteresis = hysteresis
+        self.radius = None  # projected radius the current level was picked at
+        self.segments = LOD_MIN_SEGMENTS
+        self.changes = 0
+
+    def update(self, projected_radius: float) -> bool:
+        # returns True when the level changed
+        projected_radius = abs(projected_radius)
+        if self.radius is not None and abs(projected_radius - self.radius) <= self.hysteresis * self.radius:
+            return False
+        self.radius = projected_radius
+        segments = segments_for_radius(projected_radius, self.pixel_error)
+        changed = segments != self.segments
+        self.segments = segments
+        self.changes += changed
+        return changed
+
+    def fit(self, radius: float) -> "LevelOfDetail":
+        # picks the first level from the unprojected radius, for shapes read before any paint or projection did
+        if self.radius is None:
+            self.update(radius)
+        return self
+
+    def wire_gap(self, limit: int) -> int:
+        # at most `limit` (the sphere's own wire_gap), at least 1 which leaves only the two base circles
+        if self.radius is None:
+            return limit
+        return min(max(ceil(self.radius / self.wire_spacing), 1), limit)
+
+
 class Circle:
-    def __init__(self, origin: Vector, radius: float, x_rotation: float = 0, y_rotation: float = 0, resolution=20):
+    def __init__(self, origin: Vector, radius: float, x_rotation: float = 0, y_rotation: float = 0, resolution=20,
+                 lod: LevelOfDetail = None):
         self.origin = origin
         self.radius = radius
         self.x_rotation = x_rotation
         self.y_rotation = y_rotation
         self.resolution = resolution
+        # optional LevelOfDetail, replaces resolution with a segment count fitted to the projected radius
+        self.lod = lod
+
+    @property
+    def segments(self) -> int:
+        return self.resolution if self.lod is None else self.lod.fit(self.radius).segments
 
     @property
     def normal(self) -> Vector:
@@ -220,66 +623,155 @@ class Circle:
 
     @property
     def radius_line(self) -> Vector:
-        # Returns a unit in the direction parallel to the plane in which the circle lies
-        perpendicular_vector = self.origin * self.normal
-        unit_vector = perpendicular_vector / perpendicular_vector.len()
-        return unit_vector.scale(self.radius)
+        # Returns a vector of length radius parallel to the plane in which the circle lies, it is the derivative of
+        # the normal with respect to x_rotation, so it only depends on the orientation and never degenerates.
+        base = cos(self.x_rotation)
+        return Vector(
+            base * sin(self.y_rotation),
+            sin(self.x_rotation),
+            base * cos(self.y_rotation)
+        ).scale_(self.radius)
 
     @staticmethod
     def rotate(vector: Vector, axis: Vector, theta: float):
-        # https://stackoverflow.com/a/25709323/15007549
-        vector = np.array(vector.xyz)
-        axis = np.array(axis.xyz)
-        m0 = expm(np.cross(np.eye(3), axis / norm(axis) * theta))
-        return Vector(*np.dot(m0, vector))
+        return Vector(*rotate_about_axis(vector, axis, theta)[0])
 
-    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color):
-        step = (2 * pi) / self.resolution
-        angle = step
-        radius_line, normal = self.radius_line, self.normal
-        paint = Paint(Color=stroke_color, StrokeWidth=stroke_width)
-        for _ in range(self.resolution):
-            next_angle = angle + step
+    @property
+    def template_key(self) -> tuple:
+        return template_angle(self.x_rotation), template_angle(self.y_rotation), self.segments
+
+    @property
+    def vertices(self) -> VertexBuffer:
+        # One vertex per segment start, adjacent segments share their end points.
+        template = circle_template(*self.template_key)
+        return VertexBuffer(template * self.radius).translate(self.origin)
+
+    @property
+    def edges(self) -> np.ndarray:
+        return closed_loop_edges(self.segments)
 
-            p1 = self.origin + self.rotate(radius_line, normal, angle)
-            p2 = self.origin + self.rotate(radius_line, normal, next_angle)
-            canvas.drawLine(p1.xy, p2.xy, paint)
+    def update_detail(self, projected_radius: float = None):
+        # projected_radius defaults to the radius itself, as the shapes are drawn without perspective
+        if self.lod is not None:
+            self.lod.update(self.radius if projected_radius is None else projected_radius)
 
-            angle += step
+    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color, projected_radius: float = None):
+        self.update_detail(projected_radius)
+        paint = shared_paint(stroke_color, stroke_width)
+        draw_edges(canvas, self.vertices, self.edges, paint)
+
+
+def template_angle(angle: float) -> float:
+    return round(float(angle), TEMPLATE_PRECISION)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def circle_template(x_rotation: float, y_rotation: float, resolution: int) -> np.ndarray:
+    # Read only unit circle centered at the origin, Circle instances scale and translate a copy of it.
+    unit = Circle(Vector(), 1, x_rotation, y_rotation, resolution)
+    step = (2 * pi) / resolution
+    template = rotate_about_axis(unit.radius_line, unit.normal, step * np.arange(1, resolution + 1))
+    template.flags.writeable = False
+    return template
 
 
 class SphereWireframe:
-    def __init__(self, origin: Vector, radius: float, x_rotation: float = 0, y_rotation: float = 0, wire_gap=8):
+    def __init__(self, origin: Vector, radius: float, x_rotation: float = 0, y_rotation: float = 0, wire_gap=8,
+                 resolution=20, lod: LevelOfDetail = None):
         self.origin = origin
         self.radius = radius
         self.x_rotation = x_rotation
         self.y_rotation = y_rotation
         self.wire_gap = wire_gap
+        self.resolution = resolution
+        # optional LevelOfDetail, fits the segments per circle and thins the wires (up to wire_gap) to the projected
+        # radius
+        self.lod = lod
 
-    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color):
-        vertical_base = Circle(self.origin, self.radius, self.x_rotation, self.y_rotation)
-        vertical_base.paint(canvas, stroke_width, stroke_color)
+    @property
+    def segments(self) -> int:
+        return self.resolution if self.lod is None else self.lod.fit(self.radius).segments
 
-        horizontal_base = Circle(self.origin, self.radius, self.x_rotation + (pi / 2), self.y_rotation)
-        horizontal_base.paint(canvas, stroke_width, stroke_color)
+    @property
+    def wires(self) -> int:
+        return self.wire_gap if self.lod is None else self.lod.fit(self.radius).wire_gap(self.wire_gap)
+
+    @property
+    def circles(self) -> list:
+        x_rotation, y_rotation, resolution = self.x_rotation, self.y_rotation, self.segments
+        vertical_base = Circle(self.origin, self.radius, x_rotation, y_rotation, resolution)
+        horizontal_base = Circle(self.origin, self.radius, x_rotation + (pi / 2), y_rotation, resolution)
+        circles = [vertical_base, horizontal_base]
 
-        height_step = self.radius / self.wire_gap
+        height_step = self.radius / self.wires
         current_height = height_step
+        vertical_normal, horizontal_normal = vertical_base.normal, horizontal_base.normal
 
         while current_height < self.radius:
             radius = np.sqrt((self.radius ** 2) - (current_height ** 2))
-            h1 = vertical_base.normal.scale(current_height)
-            h2 = horizontal_base.normal.scale(current_height)
-            Circle(
-                self.origin + h1, radius, self.x_rotation, self.y_rotation
-            ).paint(canvas, stroke_width, stroke_color)
-            Circle(
-                self.origin - h1, radius, self.x_rotation, self.y_rotation
-            ).paint(canvas, stroke_width, stroke_color)
-            Circle(
-                self.origin + h2, radius, self.x_rotation + (pi / 2), self.y_rotation
-            ).paint(canvas, stroke_width, stroke_color)
-            Circle(
-                self.origin - h2, radius, self.x_rotation + (pi / 2), self.y_rotation
-            ).paint(canvas, stroke_width, stroke_color)
-            current_height += height_step - (current_height / self.radius)
+            h1 = vertical_normal.scale(current_height)
+            h2 = horizontal_normal.scale(current_height)
+            circles += [
+                Circle(self.origin + h1, radius, x_rotation, y_rotation, resolution),
+                Circle(self.origin - h1, radius, x_rotation, y_rotation, resolution),
+                Circle(self.origin + h2, radius, x_rotation + (pi / 2), y_rotation, resolution),
+                Circle(self.origin - h2, radius, x_rotation + (pi / 2), y_rotation, resolution),
+            ]
+            # wires get closer towards the poles, relative to the radius so the layout scales with the sphere
+            current_height += height_step * (1 - current_height / (10 * self.radius))
+
+        return circles
+
+    @staticmethod
+    def join(circles) -> tuple:
+        # Packs every circle into one vertex buffer, offsetting each circle's edge indices accordingly.
+        buffers, edges, offset = [], [], 0
+        for circle in circles:
+            buffers.append(circle.vertices)
+            edges.append(closed_loop_edges(circle.resolution, offset))
+            offset += circle.resolution
+        return VertexBuffer.concatenate(buffers), np.concatenate(edges)
+
+    @property
+    def template_key(self) -> tuple:
+        return template_angle(self.x_rotation), template_angle(self.y_rotation), self.segments, self.wires
+
+    @property
+    def vertices(self) -> VertexBuffer:
+        template, _ = sphere_template(*self.template_key)
+        return VertexBuffer(template * self.radius).translate(self.origin)
+
+    @property
+    def edges(self) -> np.ndarray:
+        return sphere_template(*self.template_key)[1]
+
+    def visible_edges(self, view=VIEW_DIRECTION) -> np.ndarray:
+        # The surface normal is the direction from the center, a segment is visible when its midpoint lies on the
+        # hemisphere facing the viewer.
+        template, edges = sphere_template(*self.template_key)
+        midpoints = template[edges].sum(axis=1)
+        return midpoints @ np.asarray(view, dtype=float) <= 0
+
+    def update_detail(self, projected_radius: float = None):
+        # projected_radius defaults to the radius itself, as the shapes are drawn without perspective
+        if self.lod is not None:
+            self.lod.update(self.radius if projected_radius is None else projected_radius)
+
+    def paint(self, canvas: Canvas, stroke_width: float, stroke_color: Color, cull: str = None,
+              projected_radius: float = None):
+        self.update_detail(projected_radius)
+        paint = shared_paint(stroke_color, stroke_width)
+        if cull is None:
+            draw_edges(canvas, self.vertices, self.edges, paint)
+        else:
+            draw_culled_edges(canvas, self.vertices, self.edges, self.visible_edges(), paint, cull)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def sphere_template(x_rotation: float, y_rotation: float, resolution: int, wire_gap: int) -> tuple:
+    # Read only (vertices, edges) of a unit sphere wireframe centered at the origin.
+    unit = SphereWireframe(Vector(), 1, x_rotation, y_rotation, wire_gap, resolution)
+    vertices, edges = unit.join(unit.circles)
+    vertices.data.flags.writeable = False
+    edges.flags.writeable = False
+    return vertices.data, edges
@@ -0,0 +1,78 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from math import pi
+
+import skia
+
+from .headless import HeadlessWindow, encode_png, encode_gif_frame, write_gif, write_png_sequence
+
+# Per process state, every worker owns its own raster surface.
+_worker = None
+
+
+class RotationSweep:
+    """
+    Picklable scene rotating a shape (anything with y_rotation and paint) a full turn over `frame_count` frames.
+    """
+
+    def __init__(self, shape, frame_count, stroke_width=1, stroke_color=skia.Color(0, 150, 150),
+                 background=skia.Color(25, 25, 25)):
+        self.shape = shape
+        self.frame_count = frame_count
+        self.stroke_width = stroke_width
+        self.stroke_color = stroke_color
+        self.background = background
+        self.start_rotation = shape.y_rotation
+
+    def __call__(self, canvas: skia.Canvas, frame: int):
+        canvas.drawColor(self.background)
+        self.shape.y_rotation = self.start_rotation + 2 * pi * frame / self.frame_count
+        self.shape.paint(canvas, self.stroke_width, self.stroke_color)
+
+
+def _init_worker(scene, width, height, encoding, delay):
+    global _worker
+    _worker = (HeadlessWindow(width, height), scene, encoding, delay)
+
+
+def _render_worker_frame(frame):
+    window, scene, encoding, delay = _worker
+    with window.skia_surface as canvas:
+        scene(canvas, frame)
+    image = window.skia_surface.makeImageSnapshot()
+    if encoding == "gif":
+        return encode_gif_frame(image.toarray(), delay)
+    return encode_png(image)
+
+
+def render_parallel(scene, frames, width, height, encoding="png", fps=60, workers=None):
+    """
+    Renders the frame indices in `frames` across a process pool, calling scene(canvas, frame) in the workers, and
+    yields the encoded frames (PNG files or GIF frame blocks) in order. At most a few frames per worker are in flight,
+    so memory stays flat for long exports.
+    """
+    workers = workers or os.cpu_count() or 1
+    delay = max(1, round(100 / fps))
+    in_flight = deque()
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(scene, width, height, encoding, delay)) as executor:
+        for frame in frames:
+            in_flight.append(executor.submit(_render_worker_frame, frame))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def export_parallel(scene, frame_count, path, width, height, fps=60, workers=None):
+    """
+    Renders frames 0 .. frame_count - 1 in parallel, to an animated GIF if `path` ends in .gif and to a PNG sequence
+    directory otherwise. Returns the number of frames written.
+    """
+    if path.lower().endswith(".gif"):
+        frames = render_parallel(scene, range(frame_count), width, height, "gif", fps, workers)
+        return write_gif(frames, path, width, height, fps)
+    frames = render_parallel(scene, range(frame_count), width, height, "png", fps, workers)
+    return write_png_sequence(frames, path)
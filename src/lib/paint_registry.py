@@ -0,0 +1,34 @@
+from functools import lru_cache
+
+import skia
+
+# Distinct styles kept alive at once, the least recently used one is dropped (and rebuilt on its next use) beyond this.
+PAINT_CACHE_SIZE = 256
+
+FILL = skia.Paint.kFill_Style
+STROKE = skia.Paint.kStroke_Style
+
+
+@lru_cache(maxsize=PAINT_CACHE_SIZE)
+def shared_paint(color: int, stroke_width: float = 0, style=FILL, anti_alias=False) -> skia.Paint:
+    """
+    Interned skia.Paint for a (color, stroke width, style, anti alias) style, every primitive asking for the same style
+    gets the same object instead of building a new Paint per call. Shared paints must never be modified, copy them
+    with skia.Paint(paint) first.
+    """
+    return skia.Paint(Color=color, StrokeWidth=stroke_width, Style=style, AntiAlias=anti_alias)
+
+
+def paint_stats() -> dict:
+    # allocations are cache misses, hits are Paint constructions avoided
+    info = shared_paint.cache_info()
+    return {
+        "allocations": info.misses,
+        "reuses": info.hits,
+        "live": info.currsize,
+        "capacity": info.maxsize,
+    }
+
+
+def clear_paints():
+    shared_paint.cache_clear()
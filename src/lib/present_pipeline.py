@@ -0,0 +1,341 @@
+import threading
+from ctypes import byref as pointer
+from queue import Queue
+
+import numpy as np
+import sdl2 as sdl
+import skia
+
+
+class FrameBuffer:
+    """
+    A pixel buffer shared by a skia raster surface and an SDL surface, like the zero copy Window surface.
+    """
+
+    def __init__(self, width, height, pitch, depth, masks):
+        self.pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.sdl_surface = sdl.SDL_CreateRGBSurfaceFrom(self.pixels.ctypes.data, width, height, depth, pitch, *masks)
+        self.skia_surface = skia.Surface(
+            self.pixels, colorType=skia.kRGBA_8888_ColorType, alphaType=skia.kUnpremul_AlphaType
+        )
+
+    def free(self):
+        sdl.SDL_FreeSurface(self.sdl_surface)
+
+
+class PresentPipeline:
+    """
+    Double buffered rendering for the Window backends: a worker thread paints frame N+1 into one buffer while the main
+    thread blits and presents frame N from the other, so SDL window calls never leave the main thread. Paint jobs and
+    finished frames are handed over through queues of size one, render() returns once the worker is done, so state
+    read by the renderer is never changed while it paints. Frames are presented one frame late, by the next render()
+    or by flush().
+
+    With preserve_contents every buffer starts as a copy of the last painted frame, for renderers that only repaint
+    what changed (like the chess board).
+    """
+
+    def __init__(self, width, height, pitch, depth, masks, background, preserve_contents=False):
+        self.preserve_contents = preserve_contents
+        self.buffers = [FrameBuffer(width, height, pitch, depth, masks) for _ in range(2)]
+        for buffer in self.buffers:
+            with buffer.skia_surface as canvas:
+                canvas.drawColor(background)
+        self.last_painted = self.buffers[0]
+        self.pending = self.buffers[0]  # painted but not presented yet, the background until the first frame
+        self.presented_frames = 0
+
+        self.jobs = Queue(maxsize=1)
+        self.done = Queue(maxsize=1)
+        self.worker = threading.Thread(target=self.__paint_loop, name="paint", daemon=True)
+        self.worker.start()
+
+    @classmethod
+    def for_window(cls, window, background):
+        # (re)starts a Window's pipeline at its current size
+        if window.pipeline is not None:
+            window.pipeline.close()
+        return cls(
+            window.width, window.height,
+            window.PIXEL_PITCH, window.PIXEL_DEPTH, window.RGBA_MASKS,
+            background,
+            # renderers reporting damage only repaint part of the frame
+            preserve_contents=window.damage_tracking
+        )
+
+    def __paint_loop(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            buffer, paint, source = job
+            try:
+                if source is not None:
+                    np.copyto(buffer.pixels, source.pixels)
+                with buffer.skia_surface as canvas:
+                    paint(canvas)
+            except Exception as error:
+                self.done.put(error)
+            else:
+                self.done.put(None)
+
+    def render(self, sdl_window, paint, stats=None):
+        """
+        Paints a frame with paint(canvas) on the worker thread, presenting the previous frame meanwhile.
+        """
+        back = self.buffers[1] if self.last_painted is self.buffers[0] else self.buffers[0]
+        self.jobs.put((back, paint, self.last_painted if self.preserve_contents else None))
+        self.flush(sdl_window)
+        if stats:
+            stats.mark("present")
+        error = self.done.get()
+        if stats:
+            stats.mark("paint")
+        if error is not None:
+            raise error
+        self.last_painted = self.pending = back
+
+    def flush(self, sdl_window):
+        # presents the frame still waiting, main thread only
+        if self.pending is None:
+            return
+        window_surface = sdl.SDL_GetWindowSurface(sdl_window)
+        sdl.SDL_BlitSurface(self.pending.sdl_surface, None, window_surface, None)
+        sdl.SDL_UpdateWindowSurface(sdl_window)
+        self.pending = None
+        self.presented_frames += 1
+
+    def wait_event(self, sdl_window, event, timeout) -> bool:
+        """
+        SDL_WaitEvent that keeps a painted frame for at most `timeout` seconds, to be presented while the next one is
+        painted, before presenting it on its own.
+        """
+        if self.pending is not None:
+            if sdl.SDL_WaitEventTimeout(pointer(event), max(1, int(timeout * 1000))):
+                return True
+            self.flush(sdl_window)
+        return bool(sdl.SDL_WaitEvent(pointer(event)))
+
+    def close(self):
+        self.jobs.put(None)
+        self.worker.join()
+        for buffer in self.buffers:
+            buffer.free()
+
+
+class WindowSurface:
+    """
+    Skia surface, damage tracking and presentation shared by the SDL Window backends (lib.ui_backend and
+    chess.ui_backend). A Window calls init_surface() once its size is known and create_skia_surface() again after a
+    resize, frames go through render_frame().
+    """
+    BYTE_ORDER = {
+        # ---------- ->   RED        GREEN       BLUE        ALPHA
+        "BIG_ENDIAN": (0xff000000, 0x00ff0000, 0x0000ff00, 0x000000ff),
+        "LIL_ENDIAN": (0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
+    }
+
+    PIXEL_DEPTH = 32  # BITS PER PIXEL
+    PIXEL_PITCH_FACTOR = 4  # Multiplied by Width to get BYTES PER ROW
+    # window events after which the window has to be painted and presented again in full
+    REPAINT_WINDOW_EVENTS = (sdl.SDL_WINDOWEVENT_EXPOSED, sdl.SDL_WINDOWEVENT_SHOWN, sdl.SDL_WINDOWEVENT_RESTORED)
+
+    def init_surface(self, background, zero_copy=True, frame_stats=None, damage_tracking=False, pipelined=False):
+        self.background = background
+        self.zero_copy = zero_copy
+        # optional lib.frame_stats.FrameStats, timing every phase of a frame when set
+        self.frame_stats = frame_stats
+        # With damage tracking only the (x, y, width, height) rectangles reported since the last update are copied to
+        # the window and presented, renderers report them by returning a list of rectangles (None repaints it all).
+        self.damage_tracking = damage_tracking
+        self.damage = []
+        self.full_damage = True
+        # In pipelined mode a worker thread paints every frame into one of two back buffers while this thread presents
+        # the previous one (see PresentPipeline), full frames are presented and damage is ignored.
+        self.pipelined = pipelined
+        self.pipeline = None
+
+        # SET RGBA MASKS BASED ON BYTE_ORDER
+        is_big_endian = sdl.SDL_BYTEORDER == sdl.SDL_BIG_ENDIAN
+        self.RGBA_MASKS = self.BYTE_ORDER["BIG_ENDIAN" if is_big_endian else "LIL_ENDIAN"]
+
+        # CALCULATE PIXEL PITCH
+        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
+
+        # SKIA INIT
+        # In zero copy mode skia draws straight into pixel_buffer, which sdl_surface wraps for the whole lifetime of the
+        # surface, so presenting a frame is a single blit without snapshots, copies or allocations.
+        self.pixel_buffer = None
+        self.sdl_surface = None
+        self.skia_surface = self.create_skia_surface()
+        # Creating a member variable because SDL_CreateRGBSurfaceFrom does not keep pixel data but a pointer to it,
+        # so if it were to be a local variable it'd go out of scope and be deleted by the python garbage collector.
+        self.skia_pixel_data = None
+
+    def create_skia_surface(self):
+        """
+        Initializes the main skia surface that will be drawn upon,
+        creates a raster surface.
+        """
+        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
+        if self.pipelined:
+            # frames are painted into the pipeline's buffers instead
+            self.pipeline = PresentPipeline.for_window(self, self.background)
+            return None
+
+        surface_blueprint = skia.ImageInfo.Make(
+            self.width, self.height,
+            ct=skia.kRGBA_8888_ColorType,
+            at=skia.kUnpremul_AlphaType
+        )
+        if self.zero_copy:
+            surface = self.__create_shared_surface()
+        else:
+            # noinspection PyArgumentList
+            surface = skia.Surface.MakeRaster(surface_blueprint)
+
+        self.full_damage = True
+
+        # start from the background color
+        with surface as canvas:
+            canvas.drawColor(self.background)
+
+        return surface
+
+    def __create_shared_surface(self):
+        """
+        Creates a skia surface rasterizing into a persistent pixel buffer that an SDL surface also wraps,
+        replacing (and freeing) the previous pair after a resize.
+        """
+        if self.sdl_surface is not None:
+            sdl.SDL_FreeSurface(self.sdl_surface)
+
+        self.pixel_buffer = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        self.sdl_surface = sdl.SDL_CreateRGBSurfaceFrom(
+            self.pixel_buffer.ctypes.data,
+            self.width, self.height,
+            self.PIXEL_DEPTH, self.PIXEL_PITCH,
+            *self.RGBA_MASKS
+        )
+        return skia.Surface(self.pixel_buffer, colorType=skia.kRGBA_8888_ColorType, alphaType=skia.kUnpremul_AlphaType)
+
+    def __update_pixel_data_from_skia_surface(self):
+        """
+        Converts Skia Surface into a bytes object containing pixel data
+        """
+        image = self.skia_surface.makeImageSnapshot()
+        self.skia_pixel_data = image.tobytes()
+
+    def __transform_skia_surface_to_SDL_surface(self):
+        """
+        Converts Skia Surface to an SDL surface by first converting
+        Skia Surface to Pixel Data using .__update_pixel_data_from_skia_surface
+        """
+        self.__update_pixel_data_from_skia_surface()
+        sdl_surface = sdl.SDL_CreateRGBSurfaceFrom(
+            self.skia_pixel_data,
+            self.width, self.height,
+            self.PIXEL_DEPTH, self.PIXEL_PITCH,
+            *self.RGBA_MASKS
+        )
+        return sdl_surface
+
+    def add_damage(self, x, y, width, height):
+        self.damage.append((x, y, width, height))
+
+    def damage_all(self):
+        self.full_damage = True
+
+    def report_damage(self, damage):
+        # damage as returned by a renderer
+        if damage is None:
+            self.damage_all()
+        else:
+            for rect in damage:
+                self.add_damage(*rect)
+
+    def __damaged_sdl_rects(self):
+        rects = []
+        for x, y, width, height in self.damage:
+            left, top = max(int(x), 0), max(int(y), 0)
+            right, bottom = min(int(x + width + 1), self.width), min(int(y + height + 1), self.height)
+            if right > left and bottom > top:
+                rects.append(sdl.SDL_Rect(left, top, right - left, bottom - top))
+        self.damage = []
+        return rects
+
+    def __update_damaged(self):
+        """
+        Copies and presents only the damaged parts of the shared pixel buffer.
+        """
+        rects = self.__damaged_sdl_rects()
+        if not rects:
+            return
+        window_surface = sdl.SDL_GetWindowSurface(self.sdl_window)
+        for rect in rects:
+            # blit clips the destination rect in place, hand it a copy
+            sdl.SDL_BlitSurface(self.sdl_surface, rect, window_surface, sdl.SDL_Rect(rect.x, rect.y, rect.w, rect.h))
+        if self.frame_stats:
+            self.frame_stats.mark("blit")
+        sdl.SDL_UpdateWindowSurfaceRects(self.sdl_window, (sdl.SDL_Rect * len(rects))(*rects), len(rects))
+        if self.frame_stats:
+            self.frame_stats.mark("present")
+
+    def update(self):
+        if self.pipeline is not None:
+            self.pipeline.flush(self.sdl_window)
+            return
+        if self.damage_tracking and self.zero_copy and not self.full_damage:
+            self.__update_damaged()
+            return
+        self.damage = []
+        self.full_damage = False
+
+        stats = self.frame_stats
+        window_surface = sdl.SDL_GetWindowSurface(self.sdl_window)  # the SDL surface associated with the window
+        if self.zero_copy:
+            # skia already drew into the pixels wrapped by sdl_surface
+            sdl.SDL_BlitSurface(self.sdl_surface, None, window_surface, None)
+        else:
+            transformed_skia_surface = self.__transform_skia_surface_to_SDL_surface()
+            if stats:
+                stats.mark("convert")
+            # Transfer skia surface to SDL window's surface
+            sdl.SDL_BlitSurface(
+                transformed_skia_surface, None,
+                window_surface, None
+            )
+            sdl.SDL_FreeSurface(transformed_skia_surface)
+        if stats:
+            stats.mark("blit")
+
+        # Update window with new copied data
+        sdl.SDL_UpdateWindowSurface(self.sdl_window)
+        if stats:
+            stats.mark("present")
+
+
+def render_frame(window, paint):
+    """
+    Paints one frame of a Window with paint(canvas), which returns the frame's damage, and presents it. Pipelined
+    windows paint on their pipeline's worker thread and present the frame one frame later, without damage tracking.
+    """
+    stats = window.frame_stats
+
+    def paint_frame(canvas):
+        damage = paint(canvas)
+        if stats:
+            stats.paint_overlay(canvas)
+        return damage
+
+    if window.pipeline is not None:
+        window.pipeline.render(window.sdl_window, paint_frame, stats)
+        return
+
+    with window.skia_surface as canvas:
+        window.report_damage(paint_frame(canvas))
+    if stats:
+        if stats.overlay:
+            window.add_damage(*stats.overlay_rect)
+        stats.mark("paint")
+    window.update()
@@ -0,0 +1,147 @@
+import numpy as np
+from skia import Canvas, Color, ColorWHITE, Point
+
+from .mathematical_land import Camera, VertexBuffer, apply_matrix
+from .paint_registry import shared_paint
+
+
+class SceneNode:
+    """
+    A node of the retained scene graph: a local 4x4 transform, optional geometry (Cube, Square3D, Circle,
+    SphereWireframe or anything else with vertices and edges) and child nodes. The world transform and the projected
+    segment end points are cached, and only recomputed for nodes marked dirty and the subtrees below them.
+    """
+
+    def __init__(self, geometry=None, transform: np.ndarray = None, stroke_width: float = 1,
+                 stroke_color: Color = ColorWHITE):
+        self.geometry = geometry
+        self.local_transform = np.eye(4) if transform is None else np.asarray(transform, dtype=float)
+        self.world_transform = self.local_transform
+        self.paint = shared_paint(stroke_color, stroke_width)
+
+        self.parent = None
+        self.children = []
+
+        self.transform_dirty = True  # world transform of this whole subtree is stale
+        self.geometry_dirty = True  # only this node's geometry changed
+        self.dirty_descendants = False  # some node below this one is dirty
+        self.points = []  # projected segment end points, two per edge
+
+    def add(self, child: "SceneNode") -> "SceneNode":
+        child.parent = self
+        self.children.append(child)
+        child.mark_transform_dirty()
+        return child
+
+    def remove(self, child: "SceneNode"):
+        self.children.remove(child)
+        child.parent = None
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def set_transform(self, matrix: np.ndarray):
+        self.local_transform = np.asarray(matrix, dtype=float)
+        self.mark_transform_dirty()
+
+    def apply_transform(self, matrix: np.ndarray):
+        # applied after (on top of) the current local transform
+        self.set_transform(matrix @ self.local_transform)
+
+    def modify(self, **attributes):
+        """
+        Changes attributes of the node's geometry, e.g. node.modify(x_rotation=0.5), and marks it dirty.
+        """
+        for name, value in attributes.items():
+            setattr(self.geometry, name, value)
+        self.mark_geometry_dirty()
+
+    def mark_transform_dirty(self):
+        self.transform_dirty = True
+        self.__flag_ancestors()
+
+    def mark_geometry_dirty(self):
+        # for geometry mutated in place instead of through modify()
+        self.geometry_dirty = True
+        self.__flag_ancestors()
+
+    def __flag_ancestors(self):
+        node = self.parent
+        while node is not None and not node.dirty_descendants:
+            node.dirty_descendants = True
+            node = node.parent
+
+    def update(self, camera: Camera = None, parent_changed=False) -> int:
+        """
+        Brings the cached world transform and projected points up to date, returns the number of nodes recomputed.
+        Clean subtrees are skipped without visiting their nodes.
+        """
+        changed = parent_changed or self.transform_dirty
+        if changed:
+            parent_world = None if self.parent is None else self.parent.world_transform
+            self.world_transform = self.local_transform if parent_world is None else parent_world @ self.local_transform
+
+        recomputed = 0
+        if self.geometry is not None and (changed or self.geometry_dirty):
+            self.__project(camera)
+            recomputed = 1
+        self.transform_dirty = self.geometry_dirty = False
+
+        if changed or self.dirty_descendants:
+            for child in self.children:
+                recomputed += child.update(camera, changed)
+        self.dirty_descendants = False
+        return recomputed
+
+    def __project(self, camera: Camera):
+        if hasattr(self.geometry, "update_detail"):
+            # shapes with a LevelOfDetail fit it before their vertices and edges are read
+            self.geometry.update_detail(self.__projected_radius(camera))
+        matrix = self.world_transform if camera is None else camera.mvp(self.world_transform)
+        projected = apply_matrix(matrix, self.geometry.vertices)
+        segments = projected.xy[np.asarray(self.geometry.edges).reshape(-1)].tolist()
+        self.points = [Point(x, y) for x, y in segments]
+
+    def __projected_radius(self, camera: Camera) -> float:
+        # the geometry's radius in world units (a uniform scale of the transform), then on screen at its center's depth
+        scale = abs(np.linalg.det(self.world_transform[:3, :3])) ** (1 / 3)
+        radius = self.geometry.radius * scale
+        if camera is None:
+            return radius
+        center = apply_matrix(self.world_transform, VertexBuffer.from_vectors([self.geometry.origin]))[0]
+        return camera.projected_radius(center, radius)
+
+    def __repr__(self):
+        return f"SceneNode({self.geometry!r}, {len(self.children)} children)"
+
+
+class Scene:
+    """
+    Root of a scene graph. Without a camera world coordinates are drawn orthographically (z dropped), like the shapes'
+    own paint methods.
+    """
+
+    def __init__(self, camera: Camera = None):
+        self.root = SceneNode()
+        self.camera = camera
+        self.recomputed_nodes = 0  # nodes recomputed by the last update
+
+    def set_camera(self, camera: Camera):
+        # every projected point depends on the camera
+        self.camera = camera
+        self.root.mark_transform_dirty()
+
+    def add(self, node: SceneNode) -> SceneNode:
+        return self.root.add(node)
+
+    def update(self) -> int:
+        self.recomputed_nodes = self.root.update(self.camera)
+        return self.recomputed_nodes
+
+    def paint(self, canvas: Canvas):
+        self.update()
+        for node in self.root.walk():
+            if node.points:
+                canvas.drawPoints(Canvas.kLines_PointMode, node.points, node.paint)
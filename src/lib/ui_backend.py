@@ -1,24 +1,28 @@
+from time import perf_counter
+
 import skia
 import sdl2 as sdl
 from ctypes import byref as pointer
 
+from .present_pipeline import WindowSurface, render_frame
 
-class Window:
-    DEFAULT_FLAGS = sdl.SDL_WINDOW_SHOWN
-    BYTE_ORDER = {
-        # ---------- ->   RED        GREEN       BLUE        ALPHA
-        "BIG_ENDIAN": (0xff000000, 0x00ff0000, 0x0000ff00, 0x000000ff),
-        "LIL_ENDIAN": (0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000)
-    }
 
-    PIXEL_DEPTH = 32  # BITS PER PIXEL
-    PIXEL_PITCH_FACTOR = 4  # Multiplied by Width to get BYTES PER ROW
+class Window(WindowSurface):
+    DEFAULT_FLAGS = sdl.SDL_WINDOW_SHOWN
+    DEFAULT_REFRESH_RATE = 60  # used when SDL can not tell the display's refresh rate
 
-    def __init__(self, title, width, height, x=None, y=None, flags=None, event_loop=None):
+    def __init__(self, title, width, height, x=None, y=None, flags=None, event_loop=None, zero_copy=True,
+                 frame_stats=None, damage_tracking=False, event_handler=None, frame_renderer=None, pipelined=False):
         self.title = bytes(title, "utf8")
         self.width = width
         self.height = height
         self.event_loop = event_loop
+        # Split alternative to event_loop: event_handler(event) applies an event and returns True if anything changed,
+        # frame_renderer(canvas, time) paints. Pending events are then coalesced into at most one frame per display
+        # refresh, and nothing is rendered while nothing changed.
+        self.event_handler = event_handler
+        self.frame_renderer = frame_renderer
+        self.coalesced_events = 0  # events applied to the last rendered frame
 
         # Center Window By default
         self.x, self.y = x, y
@@ -33,18 +37,7 @@ class Window:
         else:
             self.flags = flags
 
-        # SET RGBA MASKS BASED ON BYTE_ORDER
-        is_big_endian = sdl.SDL_BYTEORDER == sdl.SDL_BIG_ENDIAN
-        self.RGBA_MASKS = self.BYTE_ORDER["BIG_ENDIAN" if is_big_endian else "LIL_ENDIAN"]
-
-        # CALCULATE PIXEL PITCH
-        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
-
-        # SKIA INIT
-        self.skia_surface = self.__create_skia_surface()
-        # Creating a member variable because SDL_CreateRGBSurfaceFrom does not keep pixel data but a pointer to it,
-        # so if it were to be a local variable it'd go out of scope and be deleted by the python garbage collector.
-        self.skia_pixel_data = None
+        self.init_surface(skia.ColorWHITE, zero_copy, frame_stats, damage_tracking, pipelined)
 
         # SDL INIT
         sdl.SDL_Init(sdl.SDL_INIT_EVENTS)  # INITIALIZE SDL EVENTS
@@ -59,82 +52,111 @@ class Window:
         )
         return window
 
-    def __create_skia_surface(self):
-        """
-        Initializes the main skia surface that will be drawn upon,
-        creates a raster surface.
-        """
-        self.PIXEL_PITCH = self.PIXEL_PITCH_FACTOR * self.width
-        surface_blueprint = skia.ImageInfo.Make(
-            self.width, self.height,
-            ct=skia.kRGBA_8888_ColorType,
-            at=skia.kUnpremul_AlphaType
-        )
-        # noinspection PyArgumentList
-        surface = skia.Surface.MakeRaster(surface_blueprint)
-
-        # make the canvas white by default
-        with surface as canvas:
-            canvas.drawColor(skia.ColorWHITE)
-
-        return surface
-
-    def __update_pixel_data_from_skia_surface(self):
-        """
-        Converts Skia Surface into a bytes object containing pixel data
-        """
-        image = self.skia_surface.makeImageSnapshot()
-        self.skia_pixel_data = image.tobytes()
-
-    def __transform_skia_surface_to_SDL_surface(self):
-        """
-        Converts Skia Surface to an SDL surface by first converting
-        Skia Surface to Pixel Data using .__update_pixel_data_from_skia_surface
-        """
-        self.__update_pixel_data_from_skia_surface()
-        sdl_surface = sdl.SDL_CreateRGBSurfaceFrom(
-            self.skia_pixel_data,
-            self.width, self.height,
-            self.PIXEL_DEPTH, self.PIXEL_PITCH,
-            *self.RGBA_MASKS
-        )
-        return sdl_surface
-
-    def update(self):
-        window_surface = sdl.SDL_GetWindowSurface(self.sdl_window)  # the SDL surface associated with the window
-        transformed_skia_surface = self.__transform_skia_surface_to_SDL_surface()
-        # Transfer skia surface to SDL window's surface
-        sdl.SDL_BlitSurface(
-            transformed_skia_surface, None,
-            window_surface, None
-        )
-
-        # Update window with new copied data
-        sdl.SDL_UpdateWindowSurface(self.sdl_window)
-
     def start(self):
+        if self.event_handler is not None and self.frame_renderer is not None:
+            self.__coalescing_loop()
+        else:
+            self.__event_loop()
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
+
+    def __event_loop(self):
+        # repaints after every event through event_loop(canvas, event)
         event = sdl.SDL_Event()
+        interval = self.__display_interval()
 
         while True:
-            sdl.SDL_WaitEvent(pointer(event))
+            self.__wait_event(event, interval)
 
             window_resized = event.type == sdl.SDL_WINDOWEVENT and event.window.event == sdl.SDL_WINDOWEVENT_RESIZED
             if window_resized:
                 self.__handle_resize(event)
+            elif event.type == sdl.SDL_WINDOWEVENT and event.window.event in self.REPAINT_WINDOW_EVENTS:
+                # the window contents were lost (uncovered, shown, restored), present the whole frame again
+                self.damage_all()
 
             if event.type == sdl.SDL_QUIT:
                 break
 
             elif self.event_loop is not None:
-                with self.skia_surface as canvas:
-                    self.event_loop(canvas, event)
-                self.update()
+                stats = self.frame_stats
+                if stats:
+                    stats.begin_frame()
+                render_frame(self, lambda canvas: self.event_loop(canvas, event))
+                if stats:
+                    stats.end_frame()
+
+    def __wait_event(self, event, interval):
+        if self.pipeline is not None:
+            return self.pipeline.wait_event(self.sdl_window, event, interval)
+        return sdl.SDL_WaitEvent(pointer(event))
+
+    def __display_interval(self):
+        mode = sdl.SDL_DisplayMode()
+        display = sdl.SDL_GetWindowDisplayIndex(self.sdl_window)
+        if display < 0 or sdl.SDL_GetCurrentDisplayMode(display, pointer(mode)) != 0 or mode.refresh_rate <= 0:
+            return 1 / self.DEFAULT_REFRESH_RATE
+        return 1 / mode.refresh_rate
+
+    def __coalescing_loop(self):
+        """
+        Drains every pending event through event_handler before rendering, so bursts (key repeat, mouse motion) cost
+        a single frame, and renders at most once per display interval and only when something changed.
+        """
+        event = sdl.SDL_Event()
+        interval = self.__display_interval()
+        start_time = last_frame = perf_counter()
+        changed = True  # paint the first frame
+        coalesced = 0
+
+        while True:
+            if not changed:
+                has_event = self.__wait_event(event, interval)  # idle until something happens
+            else:
+                wait = last_frame + interval - perf_counter()
+                if wait > 0:
+                    has_event = sdl.SDL_WaitEventTimeout(pointer(event), max(1, int(wait * 1000)))
+                else:
+                    has_event = sdl.SDL_PollEvent(pointer(event))
+
+            while has_event:
+                if event.type == sdl.SDL_QUIT:
+                    return
+                if event.type == sdl.SDL_WINDOWEVENT and event.window.event == sdl.SDL_WINDOWEVENT_RESIZED:
+                    self.__handle_resize(event)
+                    changed = True
+                elif event.type == sdl.SDL_WINDOWEVENT and event.window.event in self.REPAINT_WINDOW_EVENTS:
+                    # the first frame may have been presented before the window was mapped
+                    self.damage_all()
+                    changed = True
+                elif self.event_handler(event):
+                    changed = True
+                coalesced += 1
+                has_event = sdl.SDL_PollEvent(pointer(event))
+
+            now = perf_counter()
+            if not changed or now - last_frame < interval:
+                continue
+
+            stats = self.frame_stats
+            if stats:
+                stats.begin_frame()
+                stats.record("coalesced_events", coalesced)
+            render_frame(self, lambda canvas: self.frame_renderer(canvas, now - start_time))
+            if stats:
+                stats.end_frame()
+
+            self.coalesced_events = coalesced
+            coalesced = 0
+            changed = False
+            last_frame = now
 
     def __handle_resize(self, event):
         self.width = event.window.data1
         self.height = event.window.data2
         # Create a new skia surface from the updated dimensions (required so no segfaults occur)
-        self.skia_surface = self.__create_skia_surface()
+        self.skia_surface = self.create_skia_surface()
 
 
 if __name__ == "__main__":
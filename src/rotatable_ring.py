@@ -8,9 +8,7 @@ ring = Circle(
 )
 
 
-def event_loop(canvas: Canvas, event):
-    canvas.drawColor(Color(25, 25, 25))
-
+def handle_event(event):
     if event.window.data1 == 79:
         ring.y_rotation += .05
     elif event.window.data1 == 80:
@@ -19,9 +17,21 @@ def event_loop(canvas: Canvas, event):
         ring.x_rotation += .05
     elif event.window.data1 == 81:
         ring.x_rotation -= .05
+    else:
+        return False
+    return True
+
 
+def frame_renderer(canvas: Canvas, time=0.0):
+    canvas.drawColor(Color(25, 25, 25))
     ring.paint(canvas, 3, Color(0, 255, 0))
 
 
-window = Window("Simple Ring", 1920, 1080, event_loop=event_loop)
-window.start()
+def event_loop(canvas: Canvas, event):
+    handle_event(event)
+    frame_renderer(canvas)
+
+
+if __name__ == "__main__":
+    window = Window("Simple Ring", 1920, 1080, event_handler=handle_event, frame_renderer=frame_renderer)
+    window.start()
@@ -0,0 +1,89 @@
+"""
+Microbenchmarks for the Vector operations used by Circle and Square3D, run from this directory:
+
+    python vector_benchmark.py
+    python vector_benchmark.py --number 200000 --output vector.json
+
+Reports the time per operation and the memory per Vector, next to the previous numpy cross product and a Vector
+without __slots__ for reference.
+"""
+import argparse
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from lib.mathematical_land import Vector, Circle, Square3D
+
+
+class DictVector:
+    # Vector as it was before __slots__, only used as the memory reference.
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+
+def numpy_cross(a: Vector, b: Vector) -> Vector:
+    # the previous Vector.__mul__
+    return Vector(*np.cross(np.array(a.xyz), np.array(b.xyz)))
+
+
+def operations():
+    a, b = Vector(1.5, -2.0, 3.25), Vector(-0.5, 4.0, 2.0)
+    square = Square3D(Vector(300, 500, 500), 0.3, -0.7, 500)
+    circle = Circle(Vector(910, 490, 0), 100, 0.35, 0.8)
+
+    def in_place():
+        v = Vector(1.5, -2.0, 3.25)
+        v += b
+        v -= b
+        v.scale_(2.0)
+
+    return {
+        "construct": lambda: Vector(1.5, -2.0, 3.25),
+        "add": lambda: a + b,
+        "sub": lambda: a - b,
+        "scale": lambda: a.scale(2.0),
+        "construct + iadd + isub + scale_": in_place,
+        "dot": lambda: a.dot(b),
+        "cross": lambda: a * b,
+        "cross (numpy, previous)": lambda: numpy_cross(a, b),
+        "len": lambda: a.len(),
+        "Circle.normal": lambda: circle.normal,
+        "Circle.radius_line": lambda: circle.radius_line,
+        "Square3D.points": lambda: square.points,
+    }
+
+
+def memory():
+    slotted, plain = Vector(1, 2, 3), DictVector(1, 2, 3)
+    return {
+        "Vector": sys.getsizeof(slotted),
+        "Vector without __slots__": sys.getsizeof(plain) + sys.getsizeof(plain.__dict__),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Vector operations.")
+    parser.add_argument("--number", type=int, default=100_000, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per operation, the fastest is reported")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {"ns_per_call": {}, "bytes_per_vector": memory()}
+    for name, operation in operations().items():
+        best = min(timeit.repeat(operation, number=args.number, repeat=args.repeat))
+        results["ns_per_call"][name] = 1e9 * best / args.number
+        print(f"{name:<34} {results['ns_per_call'][name]:9.1f} ns")
+    for name, size in results["bytes_per_vector"].items():
+        print(f"{name:<34} {size:9d} bytes")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())